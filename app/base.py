@@ -1,7 +1,19 @@
+import random
+import threading
 from enum import Enum
-from attr import define, field, asdict
-from typing import Any, Tuple, Callable
-from random import randint
+from attr import define, field, frozen, asdict, fields
+from typing import Any, Tuple, Callable, Generator
+from app.damage import (
+    CompiledDamage,
+    DamagePipeline,
+    Hit,
+    Modifier,
+    default_pipeline,
+)
+from app.durability import DurabilityTracker
+from app.elements import elements
+from app.hooks import HookBus
+from app.modifiers import ModifierStack, StatModifier
 
 
 class Phase(Enum):
@@ -74,6 +86,10 @@ class CanModifyPhase:
         if phase == Phase.TURN_END:
             Context.current_turn += 1
         Context.current_phase = phase
+        if Context.hooks.on_phase:
+            Context.hooks.emit("on_phase", phase)
+        if phase == Phase.TURN_START and Context.hooks.on_turn:
+            Context.hooks.emit("on_turn", Context.current_turn)
         self.run_phase_action()
 
     def run_phase_action(self):
@@ -93,31 +109,76 @@ class CanModifyPhase:
                 item.functions_by_phase[character_phase]()
 
 
+def action(*valid_action_phases: Phase, action_name: str | None = None):
+    def decorator(function: Callable) -> Callable:
+        function.action_phases = list(valid_action_phases)
+        function.action_name = action_name or function.__name__
+        return function
+
+    return decorator
+
+
 class CanHaveCustomAction:
+    class_actions: dict[str, Tuple[list[Phase], str]] = {}
+    class_actions_by_phase: dict[Phase, dict[str, str]] = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.class_actions = {}
+        for klass in reversed(cls.__mro__):
+            for attr_name, value in vars(klass).items():
+                if hasattr(value, "action_phases"):
+                    cls.class_actions[value.action_name] = (
+                        value.action_phases,
+                        attr_name,
+                    )
+
+        cls.class_actions_by_phase = {}
+        for name, (phases, attr_name) in cls.class_actions.items():
+            for phase in phases:
+                cls.class_actions_by_phase.setdefault(phase, {})[name] = attr_name
+
     def __init__(self) -> None:
         self.actions: dict[str, Tuple[list[Phase], Callable]] = {}
+        self.available_actions: dict[Phase, dict[str, Callable]] = {}
 
     def get_available_actions(
         self, phase=Phase.BATTLE_NOT_STARTED
     ) -> dict[str, Callable]:
-        available_actions: dict[str, Callable] = {}
+        if (available_actions := self.available_actions.get(phase, None)) is None:
+            available_actions = self.compile_actions(phase)
+            self.available_actions[phase] = available_actions
+        return available_actions
+
+    def compile_actions(self, phase: Phase) -> dict[str, Callable]:
+        available_actions: dict[str, Callable] = {
+            name: getattr(self, attr_name)
+            for name, attr_name in self.class_actions_by_phase.get(phase, {}).items()
+        }
         for name, action in self.actions.items():
             if phase in action[0]:
                 available_actions[name] = action[1]
-
         return available_actions
 
-    def perform_action(self, action_name: str, **kwargs):
+    def get_action(self, action_name: str) -> Callable | None:
         if (value := self.actions.get(action_name, None)) is not None:
-            value[1](**kwargs)
+            return value[1]
+        if (value := self.class_actions.get(action_name, None)) is not None:
+            return getattr(self, value[1])
+        return None
+
+    def perform_action(self, action_name: str, **kwargs):
+        if (action := self.get_action(action_name)) is not None:
+            action(**kwargs)
 
     def register_action(
         self, action_name: str, valid_action_phases: list[Phase], action: Callable
     ):
         self.actions[action_name] = (valid_action_phases, action)
+        self.invalidate_actions()
 
-    def __register_action(self):
-        pass
+    def invalidate_actions(self):
+        self.available_actions.clear()
 
 
 @define
@@ -126,7 +187,7 @@ class FlavorStat:
     description: str = field(default="")
     category: str = field(default="NO_CATEGORY")
     sub_category: str = field(default="")
-    type: list[str] = field(default=[])
+    type: list[str] = field(factory=list)
 
     def to_dict(self) -> dict[str, Any]:
         return asdict(self)
@@ -167,6 +228,55 @@ class Stat:
             return all([self_dict[k] >= stat_dict[k] for k in self_dict.keys()])
 
 
+STAT_FIELDS: tuple[str, ...] = tuple(f.name for f in fields(Stat))
+SHARED_STATS: tuple[str, ...] = (
+    "stat_on_equip",
+    "stat_to_equip",
+    "stat_to_consume",
+    "stat_on_consume",
+)
+
+
+@frozen
+class SharedFlavorStat(FlavorStat):
+    type: tuple[str, ...] = field(default=())
+
+
+@frozen
+class SharedStat(Stat):
+    pass
+
+
+class StatView(Stat):
+    __slots__ = ("owner",)
+
+    def __init__(self, owner: "Character") -> None:
+        object.__setattr__(self, "owner", None)
+        super().__init__(**owner.base_stat.to_dict())
+        object.__setattr__(self, "owner", owner)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        owner = self.owner
+        if owner is not None and name in STAT_FIELDS:
+            if value != getattr(owner.stat, name):
+                base = owner.base_stat
+                setattr(
+                    base,
+                    name,
+                    owner.modifiers.invert(name, value, getattr(base, name)),
+                )
+                owner.mark_stat_dirty(name)
+        else:
+            object.__setattr__(self, name, value)
+
+    def __getstate__(self):
+        return (super().__getstate__(), self.owner)
+
+    def __setstate__(self, state):
+        super().__setstate__(state[0])
+        object.__setattr__(self, "owner", state[1])
+
+
 class Item(CanModifyPhase, CanHaveCustomAction):
     def __init__(self, **kwargs) -> None:
         CanModifyPhase.__init__(self)
@@ -191,10 +301,68 @@ class Item(CanModifyPhase, CanHaveCustomAction):
         self.stat_to_consume = Stat(**kwargs.get("stat_to_consume", {}))
         self.stat_on_consume = Stat(**kwargs.get("stat_on_consume", {}))
 
+        self.stat_modifiers: tuple[StatModifier, ...] = tuple(
+            kwargs.get("stat_modifiers", ())
+        )
+        self.stacks: int = 1
+        self.wear_out_rate: int = kwargs.get("wear_out_rate", 1)
+        self.max_durability: int = self.stat.health
+        self.is_broken: bool = False
+        self.tracker: DurabilityTracker | None = None
+
+        self.damage_modifiers: dict[str, list[Modifier]] = {}
+        self.defensive_damage_modifiers: dict[str, list[Modifier]] = {}
+        self.pool: Any = None
+
     @property
     def is_active(self) -> bool:
         return self.stat.health > 0
 
+    def parameters(self) -> dict[str, bool | int | float | str]:
+        return {
+            name: value
+            for name, value in vars(self).items()
+            if name not in ITEM_ATTRIBUTES and type(value) in PARAMETER_TYPES
+        }
+
+    def reset(self, prototype: "Item"):
+        state = vars(self)
+        state.clear()
+        state.update(vars(prototype))
+        CanModifyPhase.__init__(self)
+        self.actions = dict(prototype.actions)
+        self.available_actions = {}
+        self.stat = Stat(*(getattr(prototype.stat, name) for name in STAT_FIELDS))
+        self.damage_modifiers = {
+            stage: list(modifiers)
+            for stage, modifiers in prototype.damage_modifiers.items()
+        }
+        self.defensive_damage_modifiers = {
+            stage: list(modifiers)
+            for stage, modifiers in prototype.defensive_damage_modifiers.items()
+        }
+        self.equipped_by = None
+        self.tracker = None
+
+    def freeze(self):
+        flavor = self.flavor
+        self.flavor = SharedFlavorStat(
+            flavor.name,
+            flavor.description,
+            flavor.category,
+            flavor.sub_category,
+            tuple(flavor.type),
+        )
+        for stat_name in SHARED_STATS:
+            stat = getattr(self, stat_name)
+            shared = SharedStat(*(getattr(stat, name) for name in STAT_FIELDS))
+            setattr(self, stat_name, shared)
+
+    def invalidate_actions(self):
+        super().invalidate_actions()
+        if self.equipped_by is not None:
+            self.equipped_by.invalidate_actions()
+
     def character_can_equip(self, equip_character: "Character") -> bool:
         return self.can_equip and equip_character.stat >= self.stat_to_equip
 
@@ -238,22 +406,41 @@ class Item(CanModifyPhase, CanHaveCustomAction):
 
     def on_equip(self, equip_character: "Character"):
         if self.character_can_equip(equip_character):
-            self.equipped_by = equip_character
-            self.equipped_by.stat += self.stat_on_equip
+            self.bind_to(equip_character)
+
+    def bind_to(self, equip_character: "Character"):
+        self.equipped_by = equip_character
+        for name, value in self.stat_on_equip.to_dict().items():
+            if value != 0:
+                equip_character.modifiers.add(self, StatModifier(name, value))
 
     def on_unequip(self):
         if self.equipped_by is not None and self.character_can_unequip():
-            self.equipped_by.stat -= self.stat_on_equip
+            self.equipped_by.modifiers.remove(self)
             self.equipped_by = None
 
     def on_apply(self, equip_character: "Character"):
         if self.character_can_apply(equip_character):
             self.equipped_by = equip_character
+            for modifier in self.stat_modifiers:
+                equip_character.modifiers.add(self, modifier)
+
+    def on_stack(self, item: "Item"):
+        if self.equipped_by is not None:
+            self.stacks += 1
+            self.stat += item.stat
+            for modifier in item.stat_modifiers:
+                self.equipped_by.modifiers.add(self, modifier)
 
     def on_unapply(self):
+        self.wear_off()
         if self.equipped_by is not None and self.character_can_unequip():
             self.equipped_by = None
 
+    def wear_off(self):
+        if self.equipped_by is not None:
+            self.equipped_by.modifiers.remove(self)
+
     def on_consume(self, consume_character: "Character"):
         if self.character_can_consume(consume_character):
             consume_character.stat += self.stat_on_consume
@@ -278,19 +465,58 @@ class Item(CanModifyPhase, CanHaveCustomAction):
             return self.stat.defense
         return 0
 
+    def get_hit(self, opponent: "Character") -> Hit:
+        hit = Hit(self.equipped_by, opponent, item=self)
+        if self.equipped_by is not None:
+            hit.bonus = self.equipped_by.stat.attack
+            if self.character_can_attack() and self.stat.attack > 0:
+                hit.attack = self.stat.attack
+                hit.is_crit = self.character_can_crit()
+        return hit
+
+    def register_damage_modifier(
+        self, stage_name: str, modifier: Modifier, defensive: bool = False
+    ):
+        modifiers = (
+            self.defensive_damage_modifiers if defensive else self.damage_modifiers
+        )
+        modifiers.setdefault(stage_name, []).append(modifier)
+        if self.equipped_by is not None:
+            self.equipped_by.invalidate()
+
     def on_attack(self):
         if self.equipped_by is not None and self.equipped_by.opponent is not None:
-            self.equipped_by.opponent.take_damage(
-                self.get_attack()
-                + self.equipped_by.stat.attack
-                - self.equipped_by.opponent.defense_by_equipment
-                - self.equipped_by.opponent.stat.defense
-            )
-            self.equipped_by.opponent.wear_out_defendables()
+            opponent = self.equipped_by.opponent
+            hit = self.get_hit(opponent)
+            Context.damage_pipeline.resolve(hit)
+            if Context.hooks.on_attack:
+                Context.hooks.emit("on_attack", hit)
+            opponent.take_damage(hit.damage)
+            opponent.wear_out_defendables()
             self.wear_out()
 
     def wear_out(self):
-        self.stat.health -= 1
+        self.stat.health -= self.wear_out_rate
+        if Context.hooks.on_wear_out:
+            Context.hooks.emit("on_wear_out", self)
+        if self.tracker is not None:
+            self.tracker.update(self)
+
+    def on_break(self):
+        self.is_broken = True
+        if self.equipped_by is not None:
+            self.equipped_by.invalidate()
+        if Context.hooks.on_break:
+            Context.hooks.emit("on_break", self)
+
+    def on_revive(self):
+        self.is_broken = False
+        if self.equipped_by is not None:
+            self.equipped_by.invalidate()
+
+
+PARAMETER_TYPES: tuple[type, ...] = (bool, int, float, str)
+ITEM_ATTRIBUTES: frozenset[str] = frozenset(vars(Item()))
 
 
 class ItemGroup:
@@ -333,7 +559,6 @@ class StatusGroup(ItemGroup):
     def add(self, item: Item) -> Item | None:
         if self.can_add(item):
             if item.flavor.name in self.group.keys():
-                self.group[item.flavor.name].stat += item.stat
                 return self.group[item.flavor.name]
             super().add(item)
             return item
@@ -362,6 +587,7 @@ class EquipGroup(ItemGroup):
             "FOOT1": None,
             "FOOT2": None,
         }
+        self.durability = DurabilityTracker()
 
     def can_add(self, item: Item) -> bool:
         return (
@@ -383,6 +609,7 @@ class EquipGroup(ItemGroup):
         if self.can_add(item) and item.can_equip_at is not None:
             super().add(item)
             self.equip_slots[item.can_equip_at] = item
+            self.durability.track(item)
             return item
         return None
 
@@ -390,6 +617,7 @@ class EquipGroup(ItemGroup):
         if self.can_remove(item) and item.can_equip_at is not None:
             super().remove(item)
             self.equip_slots[item.can_equip_at] = None
+            self.durability.untrack(item)
             return item
         return None
 
@@ -401,18 +629,21 @@ class EquipGroup(ItemGroup):
 
     def get_defendable_items(self) -> dict[str, Item]:
         return {
-            k: self.group[k]
-            for k in self.group.keys()
-            if self.group[k].character_can_defend()
+            k: item
+            for k, item in self.durability.defendable.items()
+            if item.character_can_defend()
         }
 
     def get_attackable_items(self) -> dict[str, Item]:
         return {
-            k: self.group[k]
-            for k in self.group.keys()
-            if self.group[k].character_can_attack()
+            k: item
+            for k, item in self.durability.attackable.items()
+            if item.character_can_attack()
         }
 
+    def repair(self, amount: int | None = None, only_broken: bool = False):
+        self.durability.repair_all(amount, only_broken)
+
 
 class Character(CanModifyPhase, CanHaveCustomAction):
     def __init__(self, **kwargs) -> None:
@@ -421,21 +652,41 @@ class Character(CanModifyPhase, CanHaveCustomAction):
         self.is_player = False
 
         self.flavor = FlavorStat(**kwargs.get("flavor", {}))
-        self.stat = Stat(**kwargs.get("stat", {}))
+        self.base_stat = Stat(**kwargs.get("stat", {}))
+        self.modifiers = ModifierStack(self.mark_stat_dirty)
+        self._stat = StatView(self)
+        self.dirty_stats: set[str] = set()
         self.equipped = EquipGroup()
         self.status_affect = StatusGroup()
 
-        self.__register_actions()
+        self.revision = 0
+        self.compiled_damage: CompiledDamage | None = None
 
-    def __register_actions(self):
-        self.register_action(
-            "perform_item_attack",
-            [Phase.PLAYER_ATTACK_START],
-            self.perform_item_attack,
-        )
+    @property
+    def stat(self) -> Stat:
+        if self.dirty_stats:
+            self.refresh_stats()
+        return self._stat
+
+    @stat.setter
+    def stat(self, stat: Stat):
+        for name in STAT_FIELDS:
+            setattr(self._stat, name, getattr(stat, name))
+
+    def mark_stat_dirty(self, stat_name: str):
+        self.dirty_stats.add(stat_name)
+
+    def refresh_stats(self):
+        for stat_name in self.dirty_stats:
+            object.__setattr__(
+                self._stat,
+                stat_name,
+                self.modifiers.apply(stat_name, getattr(self.base_stat, stat_name)),
+            )
+        self.dirty_stats.clear()
 
     def chance(self):
-        return randint(1, 100 - self.stat.luck)
+        return Context.rng.randint(1, 100 - self.stat.luck)
 
     @property
     def defense_by_equipment(self) -> int:
@@ -462,6 +713,25 @@ class Character(CanModifyPhase, CanHaveCustomAction):
     def get_available_actions(self, phase=None) -> dict[str, Callable]:
         return super().get_available_actions(self.current_phase())
 
+    def compile_actions(self, phase: Phase) -> dict[str, Callable]:
+        available_actions = super().compile_actions(phase)
+        for item in self.equipped.group.values():
+            for name, item_action in item.get_available_actions(phase).items():
+                available_actions.setdefault(name, item_action)
+        return available_actions
+
+    def get_action(self, action_name: str) -> Callable | None:
+        if (value := super().get_action(action_name)) is not None:
+            return value
+        for item in self.equipped.group.values():
+            if (value := item.get_action(action_name)) is not None:
+                return value
+        return None
+
+    def invalidate(self):
+        self.revision += 1
+        self.invalidate_actions()
+
     def can_equip(self, item: "Item") -> bool:
         return item.character_can_equip(self) and self.equipped.can_add(item)
 
@@ -489,31 +759,66 @@ class Character(CanModifyPhase, CanHaveCustomAction):
     def equip(self, item: "Item") -> Item | None:
         if self.can_equip(item):
             item.on_equip(self)
-            return self.equipped.add(item)
+            self.invalidate()
+            equipped = self.equipped.add(item)
+            if Context.hooks.on_equip:
+                Context.hooks.emit("on_equip", self, item)
+            return equipped
         return None
 
     def unequip(self, item: "Item") -> Item | None:
         if self.can_unequip(item):
             item.on_unequip()
-            return self.equipped.remove(item)
+            self.invalidate()
+            unequipped = self.equipped.remove(item)
+            if Context.hooks.on_unequip:
+                Context.hooks.emit("on_unequip", self, item)
+            return unequipped
         return None
 
     def apply(self, item: "Item") -> Item | None:
         if self.can_apply(item):
-            item.on_apply(self)
-            return self.status_affect.add(item)
+            applied = self.status_affect.add(item)
+            if applied is item:
+                item.on_apply(self)
+            elif applied is not None:
+                applied.on_stack(item)
+            if applied is not None and applied.flavor.type:
+                self.cancel_statuses(applied)
+            if applied is not item and item.pool is not None:
+                item.pool.release(item)
+            self.invalidate()
+            if applied is not None and Context.hooks.on_apply:
+                Context.hooks.emit("on_apply", self, applied)
+            return applied
         return None
 
+    def cancel_statuses(self, item: "Item"):
+        if applied := elements.kinds(item.flavor):
+            for status in list(self.status_affect.group.values()):
+                if status is not item and elements.is_cancelled(
+                    applied, elements.kinds(status.flavor)
+                ):
+                    self.unapply(status)
+
     def unapply(self, item: "Item") -> Item | None:
         if self.can_unapply(item):
             item.on_unapply()
-            return self.status_affect.remove(item)
+            self.invalidate()
+            unapplied = self.status_affect.remove(item)
+            if Context.hooks.on_unapply:
+                Context.hooks.emit("on_unapply", self, item)
+            if item.pool is not None:
+                item.equipped_by = None
+                item.pool.release(item)
+            return unapplied
         return None
 
     def wear_out_defendables(self):
         for item in self.equipped.get_defendable_items().values():
             item.wear_out()
 
+    @action(Phase.PLAYER_ATTACK_START)
     def perform_item_attack(self, **kwargs):
         if self.stat.agility > self.chance():
             for item in self.equipped.get_attackable_items().values():
@@ -522,30 +827,160 @@ class Character(CanModifyPhase, CanHaveCustomAction):
     def heal(self, heal: int):
         if heal > 0:
             self.stat.health += heal
+            if Context.hooks.on_heal:
+                Context.hooks.emit("on_heal", self, heal)
 
     def take_damage(self, damage: int):
         if damage > 0:
             self.stat.health -= damage
+            if Context.hooks.on_damage:
+                Context.hooks.emit("on_damage", self, damage)
+
+
+@define
+class Decision:
+    character: Character
+    actions: dict[str, Callable]
+    phase: Phase
+    turn: int
+
+
+BattleSteps = Generator[Decision, str | None, Any]
 
 
 class Battle(CanModifyPhase):
-    def __init__(self, player: Character, opponent: Character) -> None:
+    def __init__(
+        self, player: Character, opponent: Character, rng: Any = None
+    ) -> None:
         super().__init__()
+        self.operations = 0
+        self.rng = rng if rng is not None else random
+        self.player = player
+        self.opponent = opponent
+        self.current_phase = Phase.BATTLE_NOT_STARTED
+        self.current_turn = 0
         self.initiate(player, opponent)
 
     def initiate(self, player: Character, opponent: Character):
+        Context.rng = self.rng
         Context.player = player
         Context.opponent = opponent
 
         Context.player.is_player = True
         Context.opponent.is_player = False
 
-    def run(self):
-        pass
+    @property
+    def is_active(self) -> bool:
+        return Context.player is self.player and Context.opponent is self.opponent
+
+    @property
+    def is_over(self) -> bool:
+        return not (Context.player.stat.is_alive and Context.opponent.stat.is_alive)
+
+    @property
+    def winner(self) -> Character | None:
+        if Context.player.stat.is_alive and not Context.opponent.stat.is_alive:
+            return Context.player
+        if Context.opponent.stat.is_alive and not Context.player.stat.is_alive:
+            return Context.opponent
+        return None
+
+    def choose_action(
+        self, character: Character, actions: dict[str, Callable]
+    ) -> str | None:
+        if "perform_item_attack" in actions:
+            return "perform_item_attack"
+        return None
+
+    def attack_steps(
+        self, start: Phase, end: Phase, character: Character
+    ) -> BattleSteps:
+        self.switch_to_phase(start)
+        if actions := character.get_available_actions():
+            decision = Decision(character, dict(actions), start, Context.current_turn)
+            action_name = yield decision
+            while action_name is not None and action_name not in actions:
+                action_name = yield decision
+            if action_name is not None:
+                actions[action_name]()
+        self.switch_to_phase(end)
+
+    def turn_steps(self) -> BattleSteps:
+        self.switch_to_phase(Phase.TURN_START)
+        if not self.is_over:
+            yield from self.attack_steps(
+                Phase.PLAYER_ATTACK_START, Phase.PLAYER_ATTACK_END, Context.player
+            )
+        if not self.is_over:
+            yield from self.attack_steps(
+                Phase.OPPONENT_ATTACK_START,
+                Phase.OPPONENT_ATTACK_END,
+                Context.opponent,
+            )
+        self.switch_to_phase(Phase.TURN_END)
+
+    def steps(self, max_turns: int = 100) -> BattleSteps:
+        self.start()
+        while not self.is_over and self.turns_played < max_turns:
+            yield from self.turn_steps()
+        return self.finish()
+
+    def drive(self, steps: BattleSteps) -> Any:
+        try:
+            decision = next(steps)
+            while True:
+                action_name = self.choose_action(decision.character, decision.actions)
+                if action_name is not None and action_name not in decision.actions:
+                    steps.close()
+                    raise KeyError(action_name)
+                decision = steps.send(action_name)
+        except StopIteration as stop:
+            return stop.value
+
+    def run_attack(self, start: Phase, end: Phase, character: Character):
+        self.drive(self.attack_steps(start, end, character))
+
+    def run_turn(self):
+        self.drive(self.turn_steps())
+
+    @property
+    def turns_played(self) -> int:
+        return max(Context.current_turn - 1, 0)
+
+    def switch_to_phase(self, phase: Phase):
+        self.operations += 1
+        super().switch_to_phase(phase)
+        self.current_phase = Context.current_phase
+        self.current_turn = Context.current_turn
+
+    def start(self):
+        Context.current_turn = 0
+        self.switch_to_phase(Phase.BATTLE_START)
+
+    def finish(self) -> Character | None:
+        self.switch_to_phase(Phase.BATTLE_END)
+        return self.winner
+
+    def run(self, max_turns: int = 100) -> Character | None:
+        return self.drive(self.steps(max_turns))
+
+
+class BattleContext(threading.local):
+    damage_pipeline: DamagePipeline = default_pipeline
+    hooks: HookBus = HookBus()
+
+    def __init__(self) -> None:
+        self.current_turn: int = 0
+        self.player: "Character | None" = None
+        self.opponent: "Character | None" = None
+        self.current_phase: Phase = Phase.BATTLE_NOT_STARTED
+        self.rng: Any = random
+
+    def save(self) -> dict[str, Any]:
+        return dict(self.__dict__)
+
+    def restore(self, state: dict[str, Any]):
+        self.__dict__.update(state)
 
 
-class Context:
-    current_turn: int = 0
-    player: "Character | None" = None
-    opponent: "Character | None" = None
-    current_phase: Phase = Phase.BATTLE_NOT_STARTED
+Context = BattleContext()
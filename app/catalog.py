@@ -0,0 +1,120 @@
+import struct
+import threading
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Iterable
+
+from app.base import Item
+from app.registry import LazyRegistry, registry
+from app.savefile import SaveReader, SaveWriter
+
+CATALOG_MAGIC = b"PBCT"
+CATALOG_HEADER = struct.Struct("<4sII")
+CATALOG_ENTRY = struct.Struct("<HI")
+
+
+def encode_catalog(items: Iterable[Item]) -> bytes:
+    writer = SaveWriter()
+    index = bytearray()
+    count = 0
+    for item in items:
+        name = type(item).__name__.encode("utf-8")
+        index += CATALOG_ENTRY.pack(len(name), len(writer.records)) + name
+        writer.write_item(item)
+        count += 1
+    header = CATALOG_HEADER.pack(CATALOG_MAGIC, count, len(index))
+    return header + bytes(index) + writer.getvalue()
+
+
+class Catalog:
+    def __init__(self, buffer: bytes | bytearray | memoryview) -> None:
+        self.buffer = memoryview(buffer)
+        magic, count, index_size = CATALOG_HEADER.unpack_from(self.buffer, 0)
+        if magic != CATALOG_MAGIC:
+            raise ValueError("Not a battlesim item catalog")
+
+        self.offsets: dict[str, int] = {}
+        offset = CATALOG_HEADER.size
+        for _ in range(count):
+            length, record_offset = CATALOG_ENTRY.unpack_from(self.buffer, offset)
+            offset += CATALOG_ENTRY.size
+            name = str(self.buffer[offset : offset + length], "utf-8")
+            self.offsets[name] = record_offset
+            offset += length
+        self.reader = SaveReader(self.buffer[offset:])
+        self.lock = threading.Lock()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.offsets
+
+    def __iter__(self):
+        return iter(self.offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def create(self, name: str) -> Item:
+        if name not in self.offsets:
+            raise KeyError(name)
+        with self.lock:
+            # Skip the record tag, items are always stored as ITEM_TAG records.
+            self.reader.offset = self.reader.records_offset + self.offsets[name] + 1
+            return self.reader.unpack_item()
+
+    def release(self):
+        self.reader.buffer.release()
+        self.buffer.release()
+
+
+class SharedCatalog(Catalog):
+    def __init__(self, shared_memory: SharedMemory, owner: bool = False) -> None:
+        self.shared_memory = shared_memory
+        self.owner = owner
+        super().__init__(shared_memory.buf)
+
+    @property
+    def name(self) -> str:
+        return self.shared_memory.name
+
+    @classmethod
+    def publish(
+        cls, names: Iterable[str] | None = None, items: LazyRegistry = registry
+    ) -> "SharedCatalog":
+        data = encode_catalog(items.create(name) for name in (names or items))
+        shared_memory = SharedMemory(create=True, size=len(data))
+        shared_memory.buf[: len(data)] = data
+        return cls(shared_memory, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedCatalog":
+        try:
+            shared_memory = SharedMemory(name, track=False)
+        except TypeError:
+            shared_memory = SharedMemory(name)
+            # Only the publisher may unlink the segment when it shuts down.
+            resource_tracker.unregister(shared_memory._name, "shared_memory")
+        return cls(shared_memory)
+
+    def close(self):
+        self.release()
+        self.shared_memory.close()
+        if self.owner:
+            self.shared_memory.unlink()
+
+    def __enter__(self) -> "SharedCatalog":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+worker_catalog: SharedCatalog | None = None
+
+
+def attach_worker_catalog(name: str):
+    global worker_catalog
+    worker_catalog = SharedCatalog.attach(name)
+
+
+def current_items() -> Catalog | LazyRegistry:
+    return worker_catalog if worker_catalog is not None else registry
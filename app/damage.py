@@ -0,0 +1,158 @@
+from attr import define, field
+from typing import TYPE_CHECKING, Callable
+
+from app.elements import elements
+
+if TYPE_CHECKING:
+    from app.base import Character, Item
+
+
+@define
+class Hit:
+    attacker: "Character"
+    defender: "Character"
+    attack: int = field(default=0)
+    bonus: int = field(default=0)
+    item: "Item | None" = field(default=None)
+    is_crit: bool = field(default=False)
+    damage: int = field(default=0)
+
+
+Modifier = Callable[[Hit], None]
+StageFactory = Callable[["Character", "Character"], Modifier | None]
+
+
+@define
+class CompiledDamage:
+    pipeline: "DamagePipeline"
+    version: int
+    defender: "Character"
+    attacker_revision: int
+    defender_revision: int
+    modifiers: list[Modifier]
+
+    def is_valid_for(
+        self, pipeline: "DamagePipeline", attacker: "Character", defender: "Character"
+    ) -> bool:
+        return (
+            self.pipeline is pipeline
+            and self.version == pipeline.version
+            and self.defender is defender
+            and self.attacker_revision == attacker.revision
+            and self.defender_revision == defender.revision
+        )
+
+
+def crit_stage(attacker: "Character", defender: "Character") -> Modifier:
+    def crit(hit: Hit):
+        if hit.is_crit:
+            hit.damage += hit.attack
+
+    return crit
+
+
+def elemental_stage(attacker: "Character", defender: "Character") -> Modifier:
+    def elemental(hit: Hit):
+        if hit.item is None or not (attackers := elements.kinds(hit.item.flavor)):
+            return
+        if defenders := elements.kinds(defender.flavor):
+            hit.damage = int(hit.damage * elements.multiplier(attackers, defenders))
+
+    return elemental
+
+
+def armor_stage(attacker: "Character", defender: "Character") -> Modifier:
+    defense_by_equipment = defender.defense_by_equipment
+
+    def armor(hit: Hit):
+        hit.damage -= defense_by_equipment + defender.stat.defense
+
+    return armor
+
+
+def resistance_stage(attacker: "Character", defender: "Character") -> Modifier | None:
+    return None
+
+
+def clamp_stage(attacker: "Character", defender: "Character") -> Modifier:
+    def clamp(hit: Hit):
+        if hit.damage < 0:
+            hit.damage = 0
+
+    return clamp
+
+
+class DamagePipeline:
+    def __init__(self) -> None:
+        self.stages: list[tuple[int, str, StageFactory]] = []
+        self.version = 0
+
+    @classmethod
+    def default(cls) -> "DamagePipeline":
+        pipeline = cls()
+        pipeline.register_stage("crit", crit_stage, 100)
+        pipeline.register_stage("elemental", elemental_stage, 200)
+        pipeline.register_stage("armor", armor_stage, 300)
+        pipeline.register_stage("resistance", resistance_stage, 400)
+        pipeline.register_stage("clamp", clamp_stage, 500)
+        return pipeline
+
+    @property
+    def stage_names(self) -> list[str]:
+        return [name for _, name, _ in self.stages]
+
+    def register_stage(self, stage_name: str, stage: StageFactory, order: int):
+        self.unregister_stage(stage_name)
+        self.stages.append((order, stage_name, stage))
+        self.stages.sort(key=lambda s: s[0])
+        self.version += 1
+
+    def unregister_stage(self, stage_name: str):
+        stages = [s for s in self.stages if s[1] != stage_name]
+        if len(stages) != len(self.stages):
+            self.stages = stages
+            self.version += 1
+
+    def compile(self, attacker: "Character", defender: "Character") -> CompiledDamage:
+        offensive = [
+            item.damage_modifiers
+            for group in (attacker.equipped, attacker.status_affect)
+            for item in group.group.values()
+        ]
+        defensive = [
+            item.defensive_damage_modifiers
+            for group in (defender.equipped, defender.status_affect)
+            for item in group.group.values()
+        ]
+        modifiers: list[Modifier] = []
+        for _, stage_name, stage in self.stages:
+            if (modifier := stage(attacker, defender)) is not None:
+                modifiers.append(modifier)
+            for item_modifiers in offensive + defensive:
+                modifiers.extend(item_modifiers.get(stage_name, []))
+        return CompiledDamage(
+            self,
+            self.version,
+            defender,
+            attacker.revision,
+            defender.revision,
+            modifiers,
+        )
+
+    def get_compiled(
+        self, attacker: "Character", defender: "Character"
+    ) -> CompiledDamage:
+        compiled = attacker.compiled_damage
+        if compiled is None or not compiled.is_valid_for(self, attacker, defender):
+            compiled = self.compile(attacker, defender)
+            attacker.compiled_damage = compiled
+        return compiled
+
+    def resolve(self, hit: Hit) -> int:
+        hit.damage = hit.attack + hit.bonus
+        for modifier in self.get_compiled(hit.attacker, hit.defender).modifiers:
+            modifier(hit)
+        return hit.damage
+
+
+default_pipeline = DamagePipeline.default()
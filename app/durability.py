@@ -0,0 +1,97 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from app.base import Item
+
+
+class DurabilityTracker:
+    def __init__(self) -> None:
+        self.durability: dict[str, int] = {}
+        self.buckets: dict[int, dict[str, "Item"]] = {}
+        self.live: dict[str, "Item"] = {}
+        self.broken: dict[str, "Item"] = {}
+        self.attackable: dict[str, "Item"] = {}
+        self.defendable: dict[str, "Item"] = {}
+
+    def __len__(self) -> int:
+        return len(self.durability)
+
+    def track(self, item: "Item"):
+        name = item.flavor.name
+        durability = item.stat.health
+        self.durability[name] = durability
+        self.buckets.setdefault(durability, {})[name] = item
+        item.tracker = self
+        item.is_broken = durability <= 0
+        if durability > 0:
+            self.revive(item)
+        else:
+            self.broken[name] = item
+
+    def untrack(self, item: "Item"):
+        name = item.flavor.name
+        if (durability := self.durability.pop(name, None)) is None:
+            return
+        self.drop_from_bucket(name, durability)
+        self.live.pop(name, None)
+        self.broken.pop(name, None)
+        self.attackable.pop(name, None)
+        self.defendable.pop(name, None)
+        item.tracker = None
+
+    def drop_from_bucket(self, name: str, durability: int):
+        bucket = self.buckets[durability]
+        del bucket[name]
+        if not bucket:
+            del self.buckets[durability]
+
+    def revive(self, item: "Item"):
+        name = item.flavor.name
+        self.broken.pop(name, None)
+        self.live[name] = item
+        if item.can_attack:
+            self.attackable[name] = item
+        if item.can_defend:
+            self.defendable[name] = item
+
+    def update(self, item: "Item"):
+        name = item.flavor.name
+        if (durability := self.durability.get(name, None)) is None:
+            return
+        if durability != item.stat.health:
+            self.drop_from_bucket(name, durability)
+            durability = item.stat.health
+            self.durability[name] = durability
+            self.buckets.setdefault(durability, {})[name] = item
+
+        if durability <= 0 and name in self.live:
+            del self.live[name]
+            self.attackable.pop(name, None)
+            self.defendable.pop(name, None)
+            self.broken[name] = item
+            item.on_break()
+        elif durability > 0 and name in self.broken:
+            self.revive(item)
+            item.on_revive()
+
+    def below(self, durability: int) -> list["Item"]:
+        return [
+            item
+            for bucket_durability in sorted(self.buckets)
+            if bucket_durability <= durability
+            for item in self.buckets[bucket_durability].values()
+        ]
+
+    def repair(self, item: "Item", amount: int | None = None):
+        if amount is None:
+            item.stat.health = max(item.stat.health, item.max_durability)
+        else:
+            limit = max(item.stat.health, item.max_durability)
+            item.stat.health = min(item.stat.health + amount, limit)
+        self.update(item)
+
+    def repair_all(self, amount: int | None = None, only_broken: bool = False):
+        items = self.broken if only_broken else self.durability
+        for name in list(items):
+            item = self.broken.get(name, None) or self.live[name]
+            self.repair(item, amount)
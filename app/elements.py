@@ -0,0 +1,105 @@
+from array import array
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from app.base import FlavorStat
+
+
+class InteractionMatrix:
+    def __init__(self) -> None:
+        self.ids: dict[str, int] = {}
+        self.names: list[str] = []
+        self.stride = 0
+        self.multipliers = array("d")
+        self.crits = bytearray()
+        self.cancels = bytearray()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def intern(self, name: str) -> int:
+        if (kind := self.ids.get(name, None)) is None:
+            kind = len(self.names)
+            self.ids[name] = kind
+            self.names.append(name)
+            if kind >= self.stride:
+                self.grow(max(8, self.stride * 2))
+        return kind
+
+    def grow(self, stride: int):
+        multipliers = array("d", [1.0]) * (stride * stride)
+        crits = bytearray(stride * stride)
+        cancels = bytearray(stride * stride)
+        width = self.stride
+        for row in range(width):
+            old, new = row * width, row * stride
+            multipliers[new : new + width] = self.multipliers[old : old + width]
+            crits[new : new + width] = self.crits[old : old + width]
+            cancels[new : new + width] = self.cancels[old : old + width]
+        self.stride = stride
+        self.multipliers = multipliers
+        self.crits = crits
+        self.cancels = cancels
+
+    def kinds(self, flavor: "FlavorStat") -> tuple[int, ...]:
+        ids = self.ids
+        kinds = [ids[flavor.category]] if flavor.category in ids else []
+        if flavor.sub_category in ids:
+            kinds.append(ids[flavor.sub_category])
+        for name in flavor.type:
+            if name in ids:
+                kinds.append(ids[name])
+        return tuple(kinds)
+
+    def index(self, attacker: str, defender: str) -> int:
+        row, column = self.intern(attacker), self.intern(defender)
+        return row * self.stride + column
+
+    def set_multiplier(self, attacker: str, defender: str, multiplier: float):
+        index = self.index(attacker, defender)
+        self.multipliers[index] = multiplier
+
+    def set_crit(self, attacker: str, defender: str, crit: bool = True):
+        index = self.index(attacker, defender)
+        self.crits[index] = crit
+
+    def set_cancels(self, applied: str, active: str, cancels: bool = True):
+        index = self.index(applied, active)
+        self.cancels[index] = cancels
+
+    def multiplier(self, attackers: Iterable[int], defenders: Iterable[int]) -> float:
+        multiplier = 1.0
+        stride, multipliers = self.stride, self.multipliers
+        for attacker in attackers:
+            row = attacker * stride
+            for defender in defenders:
+                multiplier *= multipliers[row + defender]
+        return multiplier
+
+    def is_crit(self, attackers: Iterable[int], defenders: Iterable[int]) -> bool:
+        stride, crits = self.stride, self.crits
+        return any(
+            crits[attacker * stride + defender]
+            for attacker in attackers
+            for defender in defenders
+        )
+
+    def is_cancelled(self, applied: Iterable[int], active: Iterable[int]) -> bool:
+        stride, cancels = self.stride, self.cancels
+        return any(
+            cancels[kind * stride + other] for kind in applied for other in active
+        )
+
+
+def default_matrix() -> InteractionMatrix:
+    matrix = InteractionMatrix()
+    matrix.set_crit("FIRE", "UNDEAD")
+    matrix.set_multiplier("FIRE", "ICE", 1.5)
+    matrix.set_multiplier("FIRE", "FIRE", 0.5)
+    matrix.set_multiplier("ICE", "FIRE", 1.5)
+    matrix.set_multiplier("ICE", "ICE", 0.5)
+    matrix.set_cancels("FIRE", "ICE")
+    return matrix
+
+
+elements = default_matrix()
@@ -0,0 +1,88 @@
+from math import inf, nan, sqrt
+from attr import define, field
+
+Z_95 = 1.959963984540054
+
+
+def wilson_interval(
+    successes: int, trials: int, z: float = Z_95
+) -> tuple[float, float]:
+    if trials == 0:
+        return (0.0, 1.0)
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    centre = (p + z * z / (2 * trials)) / denominator
+    margin = z * sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials))
+    margin /= denominator
+    return (max(0.0, centre - margin), min(1.0, centre + margin))
+
+
+@define
+class RunningStats:
+    count: int = field(default=0)
+    mean: float = field(default=0.0)
+    m2: float = field(default=0.0)
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stddev(self) -> float:
+        return sqrt(self.variance)
+
+    @property
+    def stderr(self) -> float:
+        return sqrt(self.variance / self.count) if self.count > 1 else inf
+
+    def half_width(self, z: float = Z_95) -> float:
+        return z * self.stderr
+
+    def add(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def merge(self, stats: "RunningStats"):
+        if stats.count == 0:
+            return
+        count = self.count + stats.count
+        delta = stats.mean - self.mean
+        self.mean += delta * stats.count / count
+        self.m2 += stats.m2 + delta * delta * self.count * stats.count / count
+        self.count = count
+
+
+@define
+class QuantileSketch:
+    resolution: float = field(default=1.0)
+    counts: dict[int, int] = field(factory=dict)
+    count: int = field(default=0)
+
+    def add(self, value: float):
+        bucket = round(value / self.resolution)
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+        self.count += 1
+
+    def merge(self, sketch: "QuantileSketch"):
+        if sketch.resolution != self.resolution:
+            raise ValueError("Cannot merge sketches with different resolutions")
+        for bucket, count in sketch.counts.items():
+            self.counts[bucket] = self.counts.get(bucket, 0) + count
+        self.count += sketch.count
+
+    def quantile(self, q: float) -> float:
+        if self.count == 0:
+            return nan
+        rank = q * (self.count - 1)
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen > rank:
+                return bucket * self.resolution
+        return max(self.counts) * self.resolution
+
+    @property
+    def median(self) -> float:
+        return self.quantile(0.5)
@@ -0,0 +1,129 @@
+import random
+import time
+from enum import Enum
+from attr import define, field
+from typing import Any, Callable
+
+from app.base import Battle, Character
+from app.savefile import SaveReader, SaveWriter
+
+
+class StopReason(Enum):
+    FINISHED = "FINISHED"
+    MAX_TURNS = "MAX_TURNS"
+    TIME_BUDGET = "TIME_BUDGET"
+    OPERATION_BUDGET = "OPERATION_BUDGET"
+
+
+@define
+class ExecutionBudget:
+    max_turns: int | None = field(default=100)
+    max_seconds: float | None = field(default=None)
+    max_operations: int | None = field(default=None)
+
+    def exceeded(self, battle: Battle, elapsed: float) -> StopReason | None:
+        if self.max_turns is not None and battle.turns_played >= self.max_turns:
+            return StopReason.MAX_TURNS
+        if self.max_seconds is not None and elapsed >= self.max_seconds:
+            return StopReason.TIME_BUDGET
+        if self.max_operations is not None and battle.operations >= self.max_operations:
+            return StopReason.OPERATION_BUDGET
+        return None
+
+
+@define
+class Checkpoint:
+    data: bytes
+    rng_state: Any
+    operations: int
+    elapsed: float
+
+    @classmethod
+    def capture(cls, battle: Battle, elapsed: float) -> "Checkpoint":
+        writer = SaveWriter()
+        writer.write_battle(battle)
+        return cls(writer.getvalue(), battle.rng.getstate(), battle.operations, elapsed)
+
+    def restore(self) -> Battle:
+        (saved,) = SaveReader(self.data)
+        rng = random.Random()
+        rng.setstate(self.rng_state)
+        battle = saved.restore(rng)
+        battle.operations = self.operations
+        return battle
+
+
+@define
+class ExecutionResult:
+    reason: StopReason
+    winner: Character | None
+    turns: int
+    operations: int
+    elapsed: float
+    checkpoint: Checkpoint | None = field(default=None)
+
+    @property
+    def is_stalemate(self) -> bool:
+        return self.reason != StopReason.FINISHED
+
+
+class BattleRunner:
+    def __init__(
+        self,
+        battle: Battle,
+        budget: ExecutionBudget | None = None,
+        checkpoint_every: int | None = None,
+        on_checkpoint: Callable[[Checkpoint], None] | None = None,
+        elapsed: float = 0.0,
+        started: bool = False,
+    ) -> None:
+        self.battle = battle
+        self.budget = budget if budget is not None else ExecutionBudget()
+        self.checkpoint_every = checkpoint_every
+        self.on_checkpoint = on_checkpoint
+        self.elapsed = elapsed
+        self.started = started
+
+    @classmethod
+    def resume(cls, checkpoint: Checkpoint, **kwargs) -> "BattleRunner":
+        return cls(
+            checkpoint.restore(), elapsed=checkpoint.elapsed, started=True, **kwargs
+        )
+
+    def checkpoint(self) -> Checkpoint:
+        return Checkpoint.capture(self.battle, self.elapsed)
+
+    def run(self) -> ExecutionResult:
+        started_at = time.perf_counter() - self.elapsed
+        if not self.started:
+            self.battle.start()
+            self.started = True
+
+        reason = StopReason.FINISHED
+        checkpoint = None
+        while not self.battle.is_over:
+            self.elapsed = time.perf_counter() - started_at
+            exceeded = self.budget.exceeded(self.battle, self.elapsed)
+            if exceeded is not None:
+                reason = exceeded
+                checkpoint = self.checkpoint()
+                break
+            self.battle.run_turn()
+            if (
+                self.checkpoint_every
+                and self.on_checkpoint is not None
+                and self.battle.turns_played % self.checkpoint_every == 0
+            ):
+                self.elapsed = time.perf_counter() - started_at
+                self.on_checkpoint(self.checkpoint())
+
+        winner = self.battle.finish()
+        self.elapsed = time.perf_counter() - started_at
+        return ExecutionResult(
+            reason,
+            winner,
+            self.battle.turns_played,
+            self.battle.operations,
+            self.elapsed,
+            checkpoint,
+        )
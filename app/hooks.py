@@ -0,0 +1,69 @@
+from typing import Any, Callable
+
+HOOK_EVENTS: tuple[str, ...] = (
+    "on_phase",
+    "on_turn",
+    "on_attack",
+    "on_damage",
+    "on_heal",
+    "on_equip",
+    "on_unequip",
+    "on_apply",
+    "on_unapply",
+    "on_wear_out",
+    "on_break",
+)
+
+
+class HookBus:
+    def __init__(self) -> None:
+        self.subscribers: dict[str, list[tuple[int, int, Callable]]] = {
+            event: [] for event in HOOK_EVENTS
+        }
+        self.subscription_count = 0
+        for event in HOOK_EVENTS:
+            setattr(self, event, ())
+
+    def subscribe(self, event: str, handler: Callable, priority: int = 0):
+        if event not in self.subscribers:
+            raise ValueError(f"Unknown hook event: {event}")
+        self.subscription_count += 1
+        self.subscribers[event].append((-priority, self.subscription_count, handler))
+        self.subscribers[event].sort(key=lambda s: (s[0], s[1]))
+        self.compile(event)
+
+    def unsubscribe(self, event: str, handler: Callable):
+        if event in self.subscribers:
+            self.subscribers[event] = [
+                s for s in self.subscribers[event] if s[2] != handler
+            ]
+            self.compile(event)
+
+    def on(self, event: str, priority: int = 0) -> Callable[[Callable], Callable]:
+        def decorator(handler: Callable) -> Callable:
+            self.subscribe(event, handler, priority)
+            return handler
+
+        return decorator
+
+    def register_plugin(self, plugin: Any, priority: int = 0):
+        for event in HOOK_EVENTS:
+            if callable(handler := getattr(plugin, event, None)):
+                self.subscribe(event, handler, priority)
+
+    def unregister_plugin(self, plugin: Any):
+        for event in HOOK_EVENTS:
+            if callable(handler := getattr(plugin, event, None)):
+                self.unsubscribe(event, handler)
+
+    def clear(self):
+        for event in HOOK_EVENTS:
+            self.subscribers[event] = []
+            self.compile(event)
+
+    def compile(self, event: str):
+        setattr(self, event, tuple(s[2] for s in self.subscribers[event]))
+
+    def emit(self, event: str, *args, **kwargs):
+        for handler in getattr(self, event):
+            handler(*args, **kwargs)
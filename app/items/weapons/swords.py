@@ -1,5 +1,7 @@
-from app.base import Item, Phase
-from app.status.afflictions.elemental import Burning, Freeze
+from app.base import Context, Item, Phase, action
+from app.damage import Hit
+from app.elements import elements
+from app.pool import item_pool
 from textwrap import dedent
 
 
@@ -89,35 +91,31 @@ class FlameSword(Item):
                 ),
                 "category": "WEAPON",
                 "sub_category": "MAGIC_SWORD",
+                "type": ["FIRE"],
             },
             stat={"health": 14, "attack": 5},
             stat_to_equip={"strength": 15, "intelligence": 10},
             can_equip=True,
             can_attack=True,
             can_equip_at="HAND1",
+            wear_out_rate=2,
         )
         self.burning_probability = 25
 
     def character_can_crit(self) -> bool:
-        if (
+        return (
             self.equipped_by is not None
             and self.equipped_by.opponent is not None
-            and "UNDEAD"
-            in [
-                self.equipped_by.opponent.flavor.category,
-                self.equipped_by.opponent.flavor.sub_category,
-            ]
-        ):
-            return True
-        return False
+            and elements.is_crit(
+                elements.kinds(self.flavor),
+                elements.kinds(self.equipped_by.opponent.flavor),
+            )
+        )
 
     def on_attack(self):
         super().on_attack()
         if self.equipped_by.chance() < self.burning_probability:
-            self.equipped_by.opponent.apply(Burning())
-
-    def wear_out(self):
-        self.stat.health -= 2
+            self.equipped_by.opponent.apply(item_pool.acquire("Burning"))
 
 
 class FrostSword(Item):
@@ -137,21 +135,17 @@ class FrostSword(Item):
                 ),
                 "category": "WEAPON",
                 "sub_category": "MAGIC_SWORD",
+                "type": ["ICE"],
             },
             stat={"health": 14, "attack": 5},
             stat_to_equip={"strength": 12, "intelligence": 8},
             can_equip=True,
             can_attack=True,
             can_equip_at="HAND1",
+            wear_out_rate=2,
         )
         self.freeze_probability = 25
         self.ice_bolt_freeze_probability = 60
-        self.__register_actions()
-
-    def __register_actions(self):
-        self.register_action(
-            "shoot_ice_bolts", [Phase.PLAYER_ATTACK_START], self.shoot_ice_bolts
-        )
 
     def on_attack(self):
         super().on_attack()
@@ -160,8 +154,9 @@ class FrostSword(Item):
             and self.equipped_by.opponent is not None
             and self.equipped_by.chance() < self.freeze_probability
         ):
-            self.equipped_by.opponent.apply(Freeze())
+            self.equipped_by.opponent.apply(item_pool.acquire("Freeze"))
 
+    @action(Phase.PLAYER_ATTACK_START)
     def shoot_ice_bolts(self, **kwargs):
         if (
             self.equipped_by is not None
@@ -169,13 +164,11 @@ class FrostSword(Item):
             and self.equipped_by.stat.mana >= 4
         ):
             if self.equipped_by.chance() < self.ice_bolt_freeze_probability:
-                self.equipped_by.opponent.apply(Freeze())
-            self.equipped_by.opponent.take_damage(
-                15
-                - self.equipped_by.opponent.defense_by_equipment
-                - self.equipped_by.opponent.stat.defense
+                self.equipped_by.opponent.apply(item_pool.acquire("Freeze"))
+            opponent = self.equipped_by.opponent
+            opponent.take_damage(
+                Context.damage_pipeline.resolve(
+                    Hit(self.equipped_by, opponent, attack=15, item=self)
+                )
             )
             self.wear_out()
-
-    def wear_out(self):
-        self.stat.health -= 2
@@ -0,0 +1,11 @@
+# Generated by `python -m app.registry`, do not edit by hand.
+MANIFEST: dict[str, str] = {
+    "Burning": "app.status.afflictions.elemental",
+    "FlameSword": "app.items.weapons.swords",
+    "Freeze": "app.status.afflictions.elemental",
+    "FrostSword": "app.items.weapons.swords",
+    "IronSword": "app.items.weapons.swords",
+    "Poisoned": "app.status.afflictions.poisonous",
+    "RustedSword": "app.items.weapons.swords",
+    "SilverSword": "app.items.weapons.swords",
+}
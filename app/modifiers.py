@@ -0,0 +1,109 @@
+from enum import Enum
+from math import floor
+from attr import define, field, frozen
+from typing import Any, Callable
+
+
+class ModifierLayer(Enum):
+    ADDITIVE = "ADDITIVE"
+    MULTIPLICATIVE = "MULTIPLICATIVE"
+    OVERRIDE = "OVERRIDE"
+
+
+@frozen
+class StatModifier:
+    stat_name: str
+    value: int | float
+    layer: ModifierLayer = field(default=ModifierLayer.ADDITIVE)
+    priority: int = field(default=0)
+
+
+@define
+class StatLayers:
+    additive: int = field(default=0)
+    multiplicative: float = field(default=1.0)
+    override: int | None = field(default=None)
+
+    def apply(self, value: int) -> int:
+        if self.override is not None:
+            return self.override
+        if self.multiplicative != 1.0:
+            return int((value + self.additive) * self.multiplicative)
+        return value + self.additive
+
+    def invert(self, value: int, base: int) -> int:
+        if self.override is not None or self.multiplicative == 0:
+            return base + value - self.apply(base)
+        if self.multiplicative == 1.0:
+            return value - self.additive
+        target = value / self.multiplicative - self.additive
+        for candidate in (floor(target), floor(target) + 1):
+            if self.apply(candidate) == value:
+                return candidate
+        return round(target)
+
+
+class ModifierStack:
+    def __init__(self, on_change: Callable[[str], None] | None = None) -> None:
+        self.modifiers: dict[str, list[tuple[Any, StatModifier]]] = {}
+        self.layers: dict[str, StatLayers] = {}
+        self.on_change = on_change
+
+    def __len__(self) -> int:
+        return sum(len(modifiers) for modifiers in self.modifiers.values())
+
+    def add(self, source: Any, modifier: StatModifier):
+        self.modifiers.setdefault(modifier.stat_name, []).append((source, modifier))
+        self.recompute(modifier.stat_name)
+
+    def remove(self, source: Any) -> list[StatModifier]:
+        removed: list[StatModifier] = []
+        for stat_name in list(self.modifiers.keys()):
+            kept = []
+            for entry in self.modifiers[stat_name]:
+                if entry[0] is source:
+                    removed.append(entry[1])
+                else:
+                    kept.append(entry)
+            if len(kept) != len(self.modifiers[stat_name]):
+                self.modifiers[stat_name] = kept
+                self.recompute(stat_name)
+        return removed
+
+    def has_source(self, source: Any) -> bool:
+        return any(
+            entry[0] is source
+            for modifiers in self.modifiers.values()
+            for entry in modifiers
+        )
+
+    def recompute(self, stat_name: str):
+        modifiers = self.modifiers.get(stat_name, [])
+        if len(modifiers) == 0:
+            self.modifiers.pop(stat_name, None)
+            self.layers.pop(stat_name, None)
+        else:
+            layers = StatLayers()
+            override: StatModifier | None = None
+            for _, modifier in modifiers:
+                if modifier.layer == ModifierLayer.ADDITIVE:
+                    layers.additive += modifier.value
+                elif modifier.layer == ModifierLayer.MULTIPLICATIVE:
+                    layers.multiplicative *= modifier.value
+                elif override is None or modifier.priority >= override.priority:
+                    override = modifier
+            if override is not None:
+                layers.override = override.value
+            self.layers[stat_name] = layers
+        if self.on_change is not None:
+            self.on_change(stat_name)
+
+    def apply(self, stat_name: str, value: int) -> int:
+        if (layers := self.layers.get(stat_name, None)) is not None:
+            return layers.apply(value)
+        return value
+
+    def invert(self, stat_name: str, value: int, base: int) -> int:
+        if (layers := self.layers.get(stat_name, None)) is not None:
+            return layers.invert(value, base)
+        return value
@@ -0,0 +1,90 @@
+import threading
+
+from app.base import Item
+from app.registry import LazyRegistry, registry
+
+
+class PoolShard:
+    def __init__(self) -> None:
+        self.free: dict[str, list[Item]] = {}
+        self.idle: set[int] = set()
+        self.created = 0
+        self.reused = 0
+
+
+class ItemPool:
+    def __init__(self, max_size: int = 256, items: LazyRegistry = registry) -> None:
+        self.max_size = max_size
+        self.items = items
+        self.prototypes: dict[str, Item] = {}
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.shards: list[PoolShard] = []
+
+    @property
+    def created(self) -> int:
+        return sum(shard.created for shard in self.shards)
+
+    @property
+    def reused(self) -> int:
+        return sum(shard.reused for shard in self.shards)
+
+    def shard(self) -> PoolShard:
+        try:
+            return self.local.shard
+        except AttributeError:
+            shard = PoolShard()
+            with self.lock:
+                self.shards.append(shard)
+            self.local.shard = shard
+            return shard
+
+    def prototype(self, name: str) -> Item:
+        if (prototype := self.prototypes.get(name, None)) is None:
+            with self.lock:
+                if (prototype := self.prototypes.get(name, None)) is None:
+                    prototype = self.items.create(name)
+                    prototype.freeze()
+                    self.prototypes[name] = prototype
+        return prototype
+
+    def acquire(self, name: str) -> Item:
+        prototype = self.prototype(name)
+        shard = self.shard()
+        if free := shard.free.get(name, None):
+            item = free.pop()
+            shard.idle.discard(id(item))
+            item.reset(prototype)
+            item.pool = self
+            shard.reused += 1
+        else:
+            item = self.instantiate(prototype)
+            shard.created += 1
+        return item
+
+    def instantiate(self, prototype: Item) -> Item:
+        cls = type(prototype)
+        item = cls.__new__(cls)
+        item.reset(prototype)
+        item.pool = self
+        return item
+
+    def release(self, item: Item) -> bool:
+        if item.pool is not self or item.equipped_by is not None:
+            return False
+        shard = self.shard()
+        free = shard.free.setdefault(type(item).__name__, [])
+        if len(free) >= self.max_size or id(item) in shard.idle:
+            return False
+        free.append(item)
+        shard.idle.add(id(item))
+        return True
+
+    def clear(self):
+        with self.lock:
+            self.prototypes.clear()
+            self.shards.clear()
+        self.local = threading.local()
+
+
+item_pool = ItemPool()
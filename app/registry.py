@@ -0,0 +1,117 @@
+import os
+import sys
+from importlib import import_module
+
+APP_ROOT = os.path.dirname(os.path.abspath(__file__))
+MANIFEST_PATH = os.path.join(APP_ROOT, "manifest.py")
+MANIFEST_PACKAGES: tuple[str, ...] = ("items", "status")
+BASE_CLASSES: tuple[str, ...] = ("Item",)
+
+
+def build_manifest() -> dict[str, str]:
+    # Parsed rather than imported so building the manifest stays cheap too.
+    import ast
+    from pathlib import Path
+
+    root = Path(APP_ROOT)
+    classes: dict[str, tuple[str, list[str]]] = {}
+    for package in MANIFEST_PACKAGES:
+        for path in sorted((root / package).rglob("*.py")):
+            module = ".".join(("app",) + path.relative_to(root).with_suffix("").parts)
+            for node in ast.parse(path.read_text()).body:
+                if isinstance(node, ast.ClassDef):
+                    bases = [b.id for b in node.bases if isinstance(b, ast.Name)]
+                    classes[node.name] = (module, bases)
+
+    manifest: dict[str, str] = {}
+    found = set(BASE_CLASSES)
+    while True:
+        new = {
+            name
+            for name, (_, bases) in classes.items()
+            if name not in found and found.intersection(bases)
+        }
+        if not new:
+            break
+        found |= new
+    for name in sorted(found - set(BASE_CLASSES)):
+        manifest[name] = classes[name][0]
+    return manifest
+
+
+def write_manifest(manifest: dict[str, str] | None = None) -> str:
+    manifest = build_manifest() if manifest is None else manifest
+    lines = [
+        "# Generated by `python -m app.registry`, do not edit by hand.",
+        "MANIFEST: dict[str, str] = {",
+    ]
+    lines += [f'    "{name}": "{module}",' for name, module in manifest.items()]
+    lines += ["}", ""]
+    with open(MANIFEST_PATH, "w") as f:
+        f.write("\n".join(lines))
+    return MANIFEST_PATH
+
+
+class LazyRegistry:
+    def __init__(self, manifest: dict[str, str]) -> None:
+        self.manifest = manifest
+        self.loaded: dict[str, type] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.manifest
+
+    def __iter__(self):
+        return iter(self.manifest)
+
+    def __len__(self) -> int:
+        return len(self.manifest)
+
+    def __getitem__(self, name: str) -> type:
+        if (cls := self.loaded.get(name, None)) is None:
+            if name not in self.manifest:
+                raise KeyError(name)
+            cls = getattr(import_module(self.manifest[name]), name)
+            self.loaded[name] = cls
+        return cls
+
+    def get(self, name: str, default: object = None) -> type | object:
+        if name in self.manifest:
+            return self[name]
+        return default
+
+    def create(self, name: str, **kwargs) -> object:
+        return self[name](**kwargs)
+
+
+def _load_registry() -> LazyRegistry:
+    from app.manifest import MANIFEST
+
+    return LazyRegistry(MANIFEST)
+
+
+registry = _load_registry()
+
+
+def importtime(module: str) -> dict[str, int]:
+    import re
+    import subprocess
+
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings: dict[str, int] = {}
+    for line in process.stderr.splitlines():
+        if match := re.match(r"import time:\s+(\d+) \|\s+(\d+) \|\s+(.*)$", line):
+            timings[match.group(3).strip()] = int(match.group(2))
+    return timings
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["bench"]:
+        for module in sys.argv[2:] or ["app.registry", "app.items.weapons.swords"]:
+            print(f"{module}: {importtime(module).get(module, 0)} us")
+    else:
+        print(write_manifest())
@@ -0,0 +1,269 @@
+import hashlib
+import json
+import os
+import random
+import sys
+import time
+from attr import asdict, define, field
+from typing import Any, Callable, Iterable
+
+from app.base import Battle, Character
+from app.execution import BattleRunner, ExecutionBudget, StopReason
+from app.registry import registry
+from app.simulation import BattleOutcome, Matchup, battle_outcome
+
+
+class ScriptedBattle(Battle):
+    def __init__(
+        self,
+        player: Character,
+        opponent: Character,
+        rng: Any = None,
+        script: list[str | None] | None = None,
+    ) -> None:
+        super().__init__(player, opponent, rng)
+        self.script = script
+        self.actions: list[str | None] = []
+
+    def choose_action(
+        self, character: Character, actions: dict[str, Callable]
+    ) -> str | None:
+        if self.script is None:
+            choice = super().choose_action(character, actions)
+        else:
+            index = len(self.actions)
+            choice = self.script[index] if index < len(self.script) else None
+            if choice not in actions:
+                choice = None
+        self.actions.append(choice)
+        return choice
+
+
+@define
+class BattleRecord:
+    matchup: Matchup
+    seed: int
+    max_turns: int = field(default=100)
+    actions: list[str | None] = field(factory=list)
+    outcome: BattleOutcome | None = field(default=None)
+
+    @property
+    def key(self) -> str:
+        matchup = json.dumps(asdict(self.matchup), sort_keys=True)
+        digest = hashlib.sha1(matchup.encode("utf-8")).hexdigest()[:16]
+        return f"{digest}:{self.seed}:{self.max_turns}"
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self, recurse=True)
+        if self.outcome is not None:
+            data["outcome"]["stopped_by"] = self.outcome.stopped_by.value
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "BattleRecord":
+        outcome = data.get("outcome", None)
+        if outcome is not None:
+            outcome = BattleOutcome(
+                **(outcome | {"stopped_by": StopReason(outcome["stopped_by"])})
+            )
+        return cls(
+            Matchup(**data["matchup"]),
+            data["seed"],
+            data.get("max_turns", 100),
+            data.get("actions", []),
+            outcome,
+        )
+
+
+def play(
+    matchup: Matchup,
+    seed: int,
+    max_turns: int = 100,
+    script: list[str | None] | None = None,
+) -> tuple[BattleOutcome, list[str | None], float]:
+    player, opponent = matchup.build()
+    battle = ScriptedBattle(player, opponent, random.Random(seed), script)
+    started = time.perf_counter()
+    result = BattleRunner(battle, ExecutionBudget(max_turns)).run()
+    elapsed = time.perf_counter() - started
+    return battle_outcome(result, player, opponent), battle.actions, elapsed
+
+
+def record_battle(matchup: Matchup, seed: int, max_turns: int = 100) -> BattleRecord:
+    outcome, actions, _ = play(matchup, seed, max_turns)
+    return BattleRecord(matchup, seed, max_turns, actions, outcome)
+
+
+def record_corpus(
+    matchups: Iterable[Matchup], battles: int, seed: int = 0, max_turns: int = 100
+) -> list[BattleRecord]:
+    return [
+        record_battle(matchup, seed + i * battles + j, max_turns)
+        for i, matchup in enumerate(matchups)
+        for j in range(battles)
+    ]
+
+
+def save_corpus(path: str | os.PathLike, corpus: Iterable[BattleRecord]):
+    with open(path, "w", encoding="utf-8") as output:
+        for record in corpus:
+            output.write(json.dumps(record.to_dict()) + "\n")
+
+
+def load_corpus(path: str | os.PathLike) -> list[BattleRecord]:
+    with open(path, encoding="utf-8") as corpus:
+        return [
+            BattleRecord.from_dict(json.loads(line)) for line in corpus if line.strip()
+        ]
+
+
+@define
+class ReplayResult:
+    record: BattleRecord
+    outcome: BattleOutcome
+    actions: list[str | None]
+    elapsed: float
+    baseline: float | None = field(default=None)
+
+    @property
+    def matches(self) -> bool:
+        record = self.record
+        return self.outcome == record.outcome and self.actions == record.actions
+
+    @property
+    def delta(self) -> float | None:
+        return None if self.baseline is None else self.elapsed - self.baseline
+
+    @property
+    def ratio(self) -> float | None:
+        if self.baseline is None or self.baseline <= 0:
+            return None
+        return self.elapsed / self.baseline
+
+
+@define
+class ReplayReport:
+    results: list[ReplayResult] = field(factory=list)
+
+    @property
+    def mismatches(self) -> list[ReplayResult]:
+        return [result for result in self.results if not result.matches]
+
+    @property
+    def ok(self) -> bool:
+        return not self.mismatches
+
+    @property
+    def elapsed(self) -> float:
+        return sum(result.elapsed for result in self.results)
+
+    @property
+    def baseline(self) -> float | None:
+        if any(result.baseline is None for result in self.results):
+            return None
+        return sum(result.baseline for result in self.results)
+
+    def timings(self) -> dict[str, float]:
+        return {result.record.key: result.elapsed for result in self.results}
+
+    def report(self) -> str:
+        lines = []
+        for i, result in enumerate(self.results):
+            status = "ok" if result.matches else "MISMATCH"
+            line = f"#{i} seed={result.record.seed} {status}"
+            line += f" {result.elapsed * 1e3:.3f}ms"
+            if result.ratio is not None:
+                line += f" {result.delta * 1e3:+.3f}ms"
+                line += f" ({(result.ratio - 1) * 100:+.1f}%)"
+            lines.append(line)
+        summary = (
+            f"{len(self.results)} battles, {len(self.mismatches)} mismatched, "
+            f"{self.elapsed * 1e3:.3f}ms"
+        )
+        if (baseline := self.baseline) is not None and baseline > 0:
+            summary += f" ({(self.elapsed / baseline - 1) * 100:+.1f}% vs baseline)"
+        lines.append(summary)
+        return "\n".join(lines)
+
+
+def replay_battle(record: BattleRecord, repeat: int = 1) -> ReplayResult:
+    timings = []
+    for _ in range(repeat):
+        outcome, actions, elapsed = play(
+            record.matchup, record.seed, record.max_turns, record.actions
+        )
+        timings.append(elapsed)
+    return ReplayResult(record, outcome, actions, min(timings))
+
+
+def replay_corpus(
+    corpus: Iterable[BattleRecord],
+    baseline: dict[str, float] | None = None,
+    repeat: int = 3,
+) -> ReplayReport:
+    report = ReplayReport()
+    for record in corpus:
+        result = replay_battle(record, repeat)
+        if baseline is not None:
+            result.baseline = baseline.get(record.key, None)
+        report.results.append(result)
+    return report
+
+
+def save_timings(path: str | os.PathLike, report: ReplayReport):
+    with open(path, "w", encoding="utf-8") as output:
+        json.dump(report.timings(), output)
+
+
+def load_timings(path: str | os.PathLike) -> dict[str, float]:
+    with open(path, encoding="utf-8") as timings:
+        return json.load(timings)
+
+
+def default_matchups() -> list[Matchup]:
+    fighter = {"stat": {"health": 80, "attack": 5, "strength": 40, "agility": 50}}
+    swords = [name for name in registry if name.endswith("Sword")]
+    return [
+        Matchup(
+            player=fighter | {"flavor": {"name": "player"}},
+            opponent=fighter | {"flavor": {"name": "opponent"}},
+            player_items=[player],
+            opponent_items=[opponent],
+        )
+        for player in swords
+        for opponent in swords
+    ]
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m app.replay")
+    commands = parser.add_subparsers(dest="command", required=True)
+    record = commands.add_parser("record")
+    record.add_argument("corpus")
+    record.add_argument("--battles", type=int, default=10)
+    record.add_argument("--seed", type=int, default=0)
+    record.add_argument("--max-turns", type=int, default=100)
+    run = commands.add_parser("run")
+    run.add_argument("corpus")
+    run.add_argument("--baseline")
+    run.add_argument("--save")
+    run.add_argument("--repeat", type=int, default=3)
+    arguments = parser.parse_args()
+
+    if arguments.command == "record":
+        corpus = record_corpus(
+            default_matchups(), arguments.battles, arguments.seed, arguments.max_turns
+        )
+        save_corpus(arguments.corpus, corpus)
+        print(f"Recorded {len(corpus)} battles to {arguments.corpus}")
+    else:
+        baseline = load_timings(arguments.baseline) if arguments.baseline else None
+        report = replay_corpus(
+            load_corpus(arguments.corpus), baseline, arguments.repeat
+        )
+        print(report.report())
+        if arguments.save:
+            save_timings(arguments.save, report)
+        sys.exit(0 if report.ok else 1)
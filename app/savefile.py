@@ -0,0 +1,377 @@
+import struct
+from attr import define
+from typing import Any, BinaryIO, Iterable, Iterator
+
+from app.base import (
+    STAT_FIELDS,
+    Battle,
+    Character,
+    Context,
+    FlavorStat,
+    PARAMETER_TYPES,
+    Item,
+    Phase,
+    Stat,
+)
+from app.modifiers import ModifierLayer, StatModifier
+from app.registry import registry
+
+SAVE_MAGIC = b"PBSV"
+SAVE_FORMAT_VERSION = 2
+
+CHARACTER_TAG = 1
+ITEM_TAG = 2
+BATTLE_TAG = 3
+
+NO_STRING = -1
+TYPE_SEPARATOR = "\x1f"
+INT32_MAX = 2**31 - 1
+INT32_MIN = -(2**31)
+
+HEADER = struct.Struct("<4sHHII")
+STRING_LENGTH = struct.Struct("<I")
+TAG = struct.Struct("<B")
+STAT_RECORD = struct.Struct(f"<{len(STAT_FIELDS)}i")
+ITEM_RECORD = struct.Struct("<7iHiiH")
+CHARACTER_RECORD = struct.Struct("<5iBHHI")
+MODIFIER_RECORD = struct.Struct("<hiBid")
+BATTLE_RECORD = struct.Struct("<iI")
+PARAMETER_RECORD = struct.Struct("<iB")
+PARAMETER_VALUES: tuple[struct.Struct, ...] = (
+    struct.Struct("<?"),
+    struct.Struct("<q"),
+    struct.Struct("<d"),
+    struct.Struct("<i"),
+)
+
+ITEM_FLAGS: tuple[str, ...] = (
+    "can_equip",
+    "can_unequip",
+    "can_consume",
+    "can_attack",
+    "can_defend",
+    "is_status_affect",
+)
+ITEM_STATS: tuple[str, ...] = (
+    "stat",
+    "stat_on_equip",
+    "stat_to_equip",
+    "stat_to_consume",
+    "stat_on_consume",
+)
+LAYERS: tuple[ModifierLayer, ...] = tuple(ModifierLayer)
+
+
+def _encode_int(value: int | float) -> int:
+    if value >= INT32_MAX:
+        return INT32_MAX
+    if value <= INT32_MIN:
+        return INT32_MIN
+    return int(value)
+
+
+def _decode_int(value: int) -> int | float:
+    if value == INT32_MAX:
+        return float("inf")
+    if value == INT32_MIN:
+        return float("-inf")
+    return value
+
+
+@define
+class SavedBattle:
+    player: Character
+    opponent: Character
+    current_phase: Phase
+    current_turn: int
+
+    def restore(self, rng: Any = None) -> Battle:
+        battle = Battle(self.player, self.opponent, rng)
+        Context.current_phase = battle.current_phase = self.current_phase
+        Context.current_turn = battle.current_turn = self.current_turn
+        return battle
+
+
+class SaveWriter:
+    def __init__(self) -> None:
+        self.strings: dict[str, int] = {}
+        self.records = bytearray()
+        self.record_count = 0
+
+    def intern(self, value: str | None) -> int:
+        if value is None:
+            return NO_STRING
+        if (index := self.strings.get(value, None)) is None:
+            index = len(self.strings)
+            self.strings[value] = index
+        return index
+
+    def pack(self, record: struct.Struct, *values):
+        self.records += record.pack(*values)
+
+    def pack_stat(self, stat: Stat):
+        self.pack(STAT_RECORD, *(_encode_int(getattr(stat, f)) for f in STAT_FIELDS))
+
+    def pack_item(self, item: Item):
+        cls = type(item).__name__
+        flags = sum(1 << i for i, f in enumerate(ITEM_FLAGS) if getattr(item, f))
+        parameters = item.parameters()
+        self.pack(
+            ITEM_RECORD,
+            self.intern(cls if cls in registry else "Item"),
+            self.intern(item.flavor.name),
+            self.intern(item.flavor.description),
+            self.intern(item.flavor.category),
+            self.intern(item.flavor.sub_category),
+            self.intern(TYPE_SEPARATOR.join(item.flavor.type)),
+            self.intern(item.can_equip_at),
+            flags,
+            item.wear_out_rate,
+            item.stacks,
+            len(parameters),
+        )
+        for stat_name in ITEM_STATS:
+            self.pack_stat(getattr(item, stat_name))
+        for name, value in parameters.items():
+            kind = PARAMETER_TYPES.index(type(value))
+            self.pack(PARAMETER_RECORD, self.intern(name), kind)
+            if isinstance(value, str):
+                value = self.intern(value)
+            self.pack(PARAMETER_VALUES[kind], value)
+
+    def pack_character(self, character: Character):
+        items = list(character.equipped.group.values()) + list(
+            character.status_affect.group.values()
+        )
+        sources: dict[int, int] = {id(item): i for i, item in enumerate(items)}
+        modifiers = [
+            (sources.get(id(source), -1), modifier)
+            for stat_modifiers in character.modifiers.modifiers.values()
+            for source, modifier in stat_modifiers
+        ]
+        self.pack(
+            CHARACTER_RECORD,
+            self.intern(character.flavor.name),
+            self.intern(character.flavor.description),
+            self.intern(character.flavor.category),
+            self.intern(character.flavor.sub_category),
+            self.intern(TYPE_SEPARATOR.join(character.flavor.type)),
+            character.is_player,
+            len(character.equipped.group),
+            len(character.status_affect.group),
+            len(modifiers),
+        )
+        self.pack_stat(character.base_stat)
+        for item in items:
+            self.pack_item(item)
+        for source, modifier in modifiers:
+            self.pack(
+                MODIFIER_RECORD,
+                source,
+                self.intern(modifier.stat_name),
+                LAYERS.index(modifier.layer),
+                modifier.priority,
+                modifier.value,
+            )
+
+    def write_item(self, item: Item):
+        self.pack(TAG, ITEM_TAG)
+        self.pack_item(item)
+        self.record_count += 1
+
+    def write_character(self, character: Character):
+        self.pack(TAG, CHARACTER_TAG)
+        self.pack_character(character)
+        self.record_count += 1
+
+    def write_battle(self, battle: Battle):
+        if battle.is_active:
+            current_phase, current_turn = Context.current_phase, Context.current_turn
+        else:
+            current_phase, current_turn = battle.current_phase, battle.current_turn
+        self.pack(TAG, BATTLE_TAG)
+        self.pack(BATTLE_RECORD, self.intern(current_phase.value), current_turn)
+        self.pack_character(battle.player)
+        self.pack_character(battle.opponent)
+        self.record_count += 1
+
+    def write(self, record: Item | Character | Battle):
+        if isinstance(record, Item):
+            self.write_item(record)
+        elif isinstance(record, Character):
+            self.write_character(record)
+        elif isinstance(record, Battle):
+            self.write_battle(record)
+        else:
+            raise TypeError(f"Cannot save {type(record).__name__}")
+
+    def write_many(self, records: Iterable[Item | Character | Battle]):
+        for record in records:
+            self.write(record)
+
+    def getvalue(self) -> bytes:
+        output = bytearray(
+            HEADER.pack(
+                SAVE_MAGIC, SAVE_FORMAT_VERSION, 0, len(self.strings), self.record_count
+            )
+        )
+        for value in self.strings:
+            encoded = value.encode("utf-8")
+            output += STRING_LENGTH.pack(len(encoded))
+            output += encoded
+        output += self.records
+        return bytes(output)
+
+    def flush(self, stream: BinaryIO) -> int:
+        written = stream.write(self.getvalue())
+        self.strings.clear()
+        self.records.clear()
+        self.record_count = 0
+        return written
+
+
+class SaveReader:
+    def __init__(self, buffer: bytes | bytearray | memoryview) -> None:
+        self.buffer = memoryview(buffer)
+        magic, version, _, string_count, self.record_count = HEADER.unpack_from(
+            self.buffer, 0
+        )
+        if magic != SAVE_MAGIC:
+            raise ValueError("Not a battlesim save file")
+        if version != SAVE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported save format version: {version}")
+
+        offset = HEADER.size
+        self.string_spans: list[tuple[int, int]] = []
+        for _ in range(string_count):
+            (length,) = STRING_LENGTH.unpack_from(self.buffer, offset)
+            offset += STRING_LENGTH.size
+            self.string_spans.append((offset, offset + length))
+            offset += length
+        self.strings: list[str | None] = [None] * string_count
+        self.records_offset = offset
+        self.offset = offset
+
+    def string(self, index: int) -> str | None:
+        if index == NO_STRING:
+            return None
+        if (value := self.strings[index]) is None:
+            start, end = self.string_spans[index]
+            value = str(self.buffer[start:end], "utf-8")
+            self.strings[index] = value
+        return value
+
+    def types(self, index: int) -> list[str]:
+        value = self.string(index)
+        return value.split(TYPE_SEPARATOR) if value else []
+
+    def unpack(self, record: struct.Struct) -> tuple[Any, ...]:
+        values = record.unpack_from(self.buffer, self.offset)
+        self.offset += record.size
+        return values
+
+    def unpack_stat(self) -> Stat:
+        return Stat(*(_decode_int(v) for v in self.unpack(STAT_RECORD)))
+
+    def unpack_item(self) -> Item:
+        (
+            cls,
+            name,
+            desc,
+            cat,
+            sub_cat,
+            types,
+            equip_at,
+            flags,
+            wear,
+            stacks,
+            parameters,
+        ) = self.unpack(ITEM_RECORD)
+        cls_name = self.string(cls)
+        item: Item = registry[cls_name]() if cls_name in registry else Item()
+        item.flavor = FlavorStat(
+            self.string(name),
+            self.string(desc),
+            self.string(cat),
+            self.string(sub_cat),
+            self.types(types),
+        )
+        item.can_equip_at = self.string(equip_at)
+        for i, flag in enumerate(ITEM_FLAGS):
+            setattr(item, flag, bool(flags & (1 << i)))
+        item.wear_out_rate = wear
+        item.stacks = stacks
+        for stat_name in ITEM_STATS:
+            setattr(item, stat_name, self.unpack_stat())
+        for _ in range(parameters):
+            parameter, kind = self.unpack(PARAMETER_RECORD)
+            (value,) = self.unpack(PARAMETER_VALUES[kind])
+            if PARAMETER_TYPES[kind] is str:
+                value = self.string(value)
+            setattr(item, self.string(parameter), value)
+        item.max_durability = max(item.max_durability, item.stat.health)
+        item.is_broken = item.stat.health <= 0
+        return item
+
+    def unpack_character(self) -> Character:
+        name, desc, cat, sub_cat, types, is_player, equipped, statuses, modifiers = (
+            self.unpack(CHARACTER_RECORD)
+        )
+        character = Character(
+            flavor={
+                "name": self.string(name),
+                "description": self.string(desc),
+                "category": self.string(cat),
+                "sub_category": self.string(sub_cat),
+                "type": self.types(types),
+            },
+            stat=self.unpack_stat().to_dict(),
+        )
+        character.is_player = bool(is_player)
+        items = [self.unpack_item() for _ in range(equipped + statuses)]
+        for i, item in enumerate(items):
+            item.equipped_by = character
+            if i < equipped:
+                character.equipped.add(item)
+            else:
+                character.status_affect.add(item)
+        for _ in range(modifiers):
+            source, stat_name, layer, priority, value = self.unpack(MODIFIER_RECORD)
+            if LAYERS[layer] != ModifierLayer.MULTIPLICATIVE:
+                value = int(value)
+            character.modifiers.add(
+                items[source] if source >= 0 else character,
+                StatModifier(self.string(stat_name), value, LAYERS[layer], priority),
+            )
+        character.invalidate()
+        return character
+
+    def read(self) -> Item | Character | SavedBattle:
+        (tag,) = self.unpack(TAG)
+        if tag == ITEM_TAG:
+            return self.unpack_item()
+        if tag == CHARACTER_TAG:
+            return self.unpack_character()
+        if tag == BATTLE_TAG:
+            phase, turn = self.unpack(BATTLE_RECORD)
+            player = self.unpack_character()
+            opponent = self.unpack_character()
+            return SavedBattle(player, opponent, Phase(self.string(phase)), turn)
+        raise ValueError(f"Unknown record tag: {tag}")
+
+    def __iter__(self) -> Iterator[Item | Character | SavedBattle]:
+        self.offset = self.records_offset
+        for _ in range(self.record_count):
+            yield self.read()
+
+
+def dumps(records: Iterable[Item | Character | Battle]) -> bytes:
+    writer = SaveWriter()
+    writer.write_many(records)
+    return writer.getvalue()
+
+
+def loads(
+    buffer: bytes | bytearray | memoryview,
+) -> list[Item | Character | SavedBattle]:
+    return list(SaveReader(buffer))
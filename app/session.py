@@ -0,0 +1,59 @@
+from typing import Awaitable, Callable, Iterable
+
+from app.base import Battle, Character, Context, Decision, Phase
+
+
+class BattleSession:
+    def __init__(self, battle: Battle, max_turns: int = 100) -> None:
+        self.battle = battle
+        self.steps = battle.steps(max_turns)
+        outer = Context.save()
+        battle.initiate(battle.player, battle.opponent)
+        Context.current_turn = 0
+        Context.current_phase = Phase.BATTLE_NOT_STARTED
+        self.context = Context.save()
+        Context.restore(outer)
+        self.decision: Decision | None = None
+        self.winner: Character | None = None
+        self.is_over = False
+
+    def resume(self, action_name: str | None = None) -> Decision | None:
+        if self.is_over:
+            return None
+        outer = Context.save()
+        Context.restore(self.context)
+        try:
+            self.decision = self.steps.send(action_name)
+        except StopIteration as stop:
+            self.decision = None
+            self.winner = stop.value
+            self.is_over = True
+        finally:
+            self.context = Context.save()
+            Context.restore(outer)
+        return self.decision
+
+
+def run_sessions(
+    sessions: Iterable[BattleSession],
+    decide: Callable[[list[Decision]], list[str | None]],
+) -> list[Character | None]:
+    sessions = list(sessions)
+    pending = [(s, d) for s in sessions if (d := s.resume()) is not None]
+    while pending:
+        choices = decide([decision for _, decision in pending])
+        pending = [
+            (session, decision)
+            for (session, _), choice in zip(pending, choices)
+            if (decision := session.resume(choice)) is not None
+        ]
+    return [session.winner for session in sessions]
+
+
+async def play(
+    session: BattleSession, decide: Callable[[Decision], Awaitable[str | None]]
+) -> Character | None:
+    decision = session.resume()
+    while decision is not None:
+        decision = session.resume(await decide(decision))
+    return session.winner
@@ -0,0 +1,291 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+from math import sqrt
+from copy import deepcopy
+from attr import define, evolve, field
+from typing import Any
+
+from app.base import Battle, Character, Context
+from app.catalog import current_items
+from app.estimators import QuantileSketch, RunningStats, wilson_interval
+from app.execution import (
+    BattleRunner,
+    ExecutionBudget,
+    ExecutionResult,
+    StopReason,
+)
+from app.state import OutcomeCache, OutcomeDistribution, outcome_key
+from app.telemetry import BattleTelemetry
+
+PLAYER_WIN = "player"
+OPPONENT_WIN = "opponent"
+
+
+def set_parameter(targets: dict[str, Any], path: str, value: Any):
+    names = path.split(".")
+    for i in range(len(names) - 1, 0, -1):
+        if (key := ".".join(names[:i])) in targets:
+            target = targets[key]
+            attributes = names[i:]
+            break
+    else:
+        raise KeyError(f"Unknown parameter target: {path}")
+    for name in attributes[:-1]:
+        target = getattr(target, name)
+    setattr(target, attributes[-1], value)
+
+
+@define
+class Matchup:
+    player: dict[str, Any] = field(factory=dict)
+    opponent: dict[str, Any] = field(factory=dict)
+    player_items: list[str] = field(factory=list)
+    opponent_items: list[str] = field(factory=list)
+    parameters: dict[str, Any] = field(factory=dict)
+
+    def with_parameters(self, parameters: dict[str, Any]) -> "Matchup":
+        return evolve(self, parameters={**self.parameters, **parameters})
+
+    def build(self) -> tuple[Character, Character]:
+        player = Character(**deepcopy(self.player))
+        opponent = Character(**deepcopy(self.opponent))
+        targets: dict[str, Any] = {"player": player, "opponent": opponent}
+        items = current_items()
+        for name in self.player_items:
+            targets[f"player.{name}"] = items.create(name)
+        for name in self.opponent_items:
+            targets[f"opponent.{name}"] = items.create(name)
+        for path, value in self.parameters.items():
+            set_parameter(targets, path, value)
+        for name in self.player_items:
+            player.equip(targets[f"player.{name}"])
+        for name in self.opponent_items:
+            opponent.equip(targets[f"opponent.{name}"])
+        return player, opponent
+
+
+@define
+class BattleOutcome:
+    winner: str | None
+    turns: int
+    player_health: int
+    opponent_health: int
+    stopped_by: StopReason = field(default=StopReason.FINISHED)
+    simulated: bool = field(default=True)
+
+
+@define
+class BatchResult:
+    wins: int = field(default=0)
+    losses: int = field(default=0)
+    draws: int = field(default=0)
+    stalemates: int = field(default=0)
+    simulated: int = field(default=0)
+    turns_to_kill: RunningStats = field(factory=RunningStats)
+    turns_to_kill_quantiles: QuantileSketch = field(factory=QuantileSketch)
+
+    @property
+    def battles(self) -> int:
+        return self.wins + self.losses + self.draws
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.battles if self.battles else 0.0
+
+    @property
+    def mean_turns(self) -> float:
+        return self.turns_to_kill.mean
+
+    @property
+    def interval(self) -> tuple[float, float]:
+        return wilson_interval(self.win_rate * self.simulated, self.simulated)
+
+    @property
+    def half_width(self) -> float:
+        low, high = self.interval
+        return (high - low) / 2
+
+    @property
+    def turns_half_width(self) -> float:
+        count = self.turns_to_kill.count
+        if not self.simulated or not count:
+            return self.turns_to_kill.half_width()
+        return self.turns_to_kill.half_width() * sqrt(
+            count / min(count, self.simulated)
+        )
+
+    def add(self, outcome: BattleOutcome):
+        if outcome.winner == PLAYER_WIN:
+            self.wins += 1
+        elif outcome.winner == OPPONENT_WIN:
+            self.losses += 1
+        else:
+            self.draws += 1
+        if outcome.stopped_by != StopReason.FINISHED:
+            self.stalemates += 1
+        if outcome.simulated:
+            self.simulated += 1
+        if outcome.winner is not None:
+            self.turns_to_kill.add(outcome.turns)
+            self.turns_to_kill_quantiles.add(outcome.turns)
+
+    def merge(self, result: "BatchResult"):
+        self.wins += result.wins
+        self.losses += result.losses
+        self.draws += result.draws
+        self.stalemates += result.stalemates
+        self.simulated += result.simulated
+        self.turns_to_kill.merge(result.turns_to_kill)
+        self.turns_to_kill_quantiles.merge(result.turns_to_kill_quantiles)
+
+
+@define
+class ConvergenceTarget:
+    win_rate_precision: float = field(default=0.02)
+    turns_precision: float | None = field(default=None)
+    min_battles: int = field(default=30)
+    max_battles: int = field(default=10000)
+
+    def is_met(self, result: BatchResult) -> bool:
+        if result.simulated < self.min_battles:
+            return False
+        if result.half_width > self.win_rate_precision:
+            return False
+        return (
+            self.turns_precision is None
+            or result.turns_half_width <= self.turns_precision
+        )
+
+
+def battle_outcome(
+    result: ExecutionResult, player: Character, opponent: Character
+) -> BattleOutcome:
+    if result.winner is None:
+        winner_name = None
+    else:
+        winner_name = PLAYER_WIN if result.winner is player else OPPONENT_WIN
+    return BattleOutcome(
+        winner_name,
+        result.turns,
+        player.stat.health,
+        opponent.stat.health,
+        result.reason,
+    )
+
+
+def run_battle(
+    matchup: Matchup,
+    seed: int,
+    max_turns: int = 100,
+    budget: ExecutionBudget | None = None,
+    cache: OutcomeCache | None = None,
+) -> BattleOutcome:
+    player, opponent = matchup.build()
+    battle = Battle(player, opponent, random.Random(seed))
+    if cache is not None:
+        if budget is not None:
+            raise ValueError("An execution budget cannot be combined with a cache")
+        return run_memoized(battle, cache, max_turns)
+    result = BattleRunner(battle, budget or ExecutionBudget(max_turns)).run()
+    return battle_outcome(result, player, opponent)
+
+
+def predict(cache: OutcomeCache, turns_left: int) -> OutcomeDistribution | None:
+    return cache.get(outcome_key(turns_left))
+
+
+def run_memoized(
+    battle: Battle, cache: OutcomeCache, max_turns: int = 100
+) -> BattleOutcome:
+    player = Context.player
+    visited: list[tuple[Any, int]] = []
+    cached = None
+    battle.start()
+    while not battle.is_over and battle.turns_played < max_turns:
+        key = outcome_key(max_turns - battle.turns_played)
+        # Every battle of a matchup starts from the same key, so serving it would
+        # replace whole battles with resampled ones.
+        if visited and (distribution := cache.get(key)) is not None:
+            cached = distribution.sample(battle.rng)
+            break
+        visited.append((key, battle.turns_played))
+        battle.run_turn()
+
+    winner = battle.finish()
+    if cached is not None:
+        winner_name, turns_left, player_health, opponent_health, reason = cached
+        turns = battle.turns_played + turns_left
+    else:
+        if winner is None:
+            winner_name = None
+        else:
+            winner_name = PLAYER_WIN if winner is player else OPPONENT_WIN
+        turns = battle.turns_played
+        player_health = Context.player.stat.health
+        opponent_health = Context.opponent.stat.health
+        reason = StopReason.FINISHED if battle.is_over else StopReason.MAX_TURNS
+    for key, turns_played in visited:
+        cache.record(
+            key,
+            (winner_name, turns - turns_played, player_health, opponent_health, reason),
+        )
+    return BattleOutcome(
+        winner_name, turns, player_health, opponent_health, reason, cached is None
+    )
+
+
+def run_batch(
+    matchup: Matchup,
+    battles: int,
+    seed: int = 0,
+    max_turns: int = 100,
+    budget: ExecutionBudget | None = None,
+    telemetry: BattleTelemetry | None = None,
+    cache: OutcomeCache | None = None,
+) -> BatchResult:
+    result = BatchResult()
+    for i in range(battles):
+        if telemetry is not None:
+            telemetry.set_queue_depth(battles - i)
+        result.add(run_battle(matchup, seed + i, max_turns, budget, cache))
+    if telemetry is not None:
+        telemetry.set_queue_depth(0)
+    return result
+
+
+def run_batch_threaded(
+    matchup: Matchup,
+    battles: int,
+    seed: int = 0,
+    max_turns: int = 100,
+    budget: ExecutionBudget | None = None,
+    workers: int | None = None,
+) -> BatchResult:
+    result = BatchResult()
+    with ThreadPoolExecutor(workers) as executor:
+        outcomes = executor.map(
+            run_battle,
+            [matchup] * battles,
+            range(seed, seed + battles),
+            [max_turns] * battles,
+            [budget] * battles,
+        )
+        for outcome in outcomes:
+            result.add(outcome)
+    return result
+
+
+def run_until_converged(
+    matchup: Matchup,
+    target: ConvergenceTarget | None = None,
+    seed: int = 0,
+    max_turns: int = 100,
+    budget: ExecutionBudget | None = None,
+) -> tuple[BatchResult, bool]:
+    target = target if target is not None else ConvergenceTarget()
+    result = BatchResult()
+    while result.battles < target.max_battles:
+        result.add(run_battle(matchup, seed + result.battles, max_turns, budget))
+        if target.is_met(result):
+            return result, True
+    return result, False
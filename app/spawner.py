@@ -0,0 +1,151 @@
+import random
+from array import array
+from attr import define, field
+from typing import Any
+
+from app.base import STAT_FIELDS, Character, Context, Stat
+from app.pool import ItemPool, item_pool
+from app.registry import registry
+
+
+def sword_loadouts() -> list[tuple[str, ...]]:
+    return [(name,) for name in registry if name.endswith("Sword")]
+
+
+@define
+class CharacterTemplate:
+    flavor: dict[str, Any] = field(factory=dict)
+    stat: dict[str, int] = field(factory=dict)
+    jitter: dict[str, int] = field(factory=dict)
+    loadouts: list[tuple[str, ...]] = field(factory=list)
+
+
+class Wave:
+    def __init__(
+        self,
+        template: CharacterTemplate,
+        stats: dict[str, array],
+        loadouts: list[tuple[str, ...]],
+        choices: array,
+        equippable: list[tuple[str, ...]],
+        pool: ItemPool = item_pool,
+    ) -> None:
+        self.template = template
+        self.stats = stats
+        self.loadouts = loadouts
+        self.choices = choices
+        self.equippable = equippable
+        self.pool = pool
+
+    def __len__(self) -> int:
+        return len(self.choices)
+
+    def column(self, stat_name: str) -> array:
+        return self.stats[stat_name]
+
+    def stat(self, index: int) -> Stat:
+        return Stat(*(self.stats[name][index] for name in STAT_FIELDS))
+
+    def loadout(self, index: int) -> tuple[str, ...]:
+        return self.loadouts[self.choices[index]] if self.loadouts else ()
+
+    @property
+    def rejected(self) -> int:
+        return sum(
+            len(self.loadout(i)) - len(self.equippable[i]) for i in range(len(self))
+        )
+
+    def build(self, index: int) -> Character:
+        flavor = self.template.flavor
+        character = Character(
+            flavor=flavor | {"type": list(flavor.get("type", []))},
+            stat={name: self.stats[name][index] for name in STAT_FIELDS},
+        )
+        for name in self.equippable[index]:
+            item = self.pool.acquire(name)
+            item.bind_to(character)
+            character.equipped.add(item)
+            if Context.hooks.on_equip:
+                Context.hooks.emit("on_equip", character, item)
+        character.invalidate()
+        return character
+
+    def characters(self) -> list[Character]:
+        return [self.build(i) for i in range(len(self))]
+
+
+def validate_loadout(
+    stats: dict[str, array],
+    indices: list[int],
+    loadout: tuple[str, ...],
+    pool: ItemPool = item_pool,
+) -> dict[int, list[str]]:
+    equipped: dict[int, list[str]] = {i: [] for i in indices}
+    occupied: dict[str, set[int]] = {}
+    bonus: dict[str, dict[int, int]] = {}
+    floors: dict[str, int] = {}
+    for name in dict.fromkeys(loadout):
+        prototype = pool.prototype(name)
+        slot = prototype.can_equip_at
+        if not prototype.can_equip or slot is None:
+            continue
+        taken = occupied.setdefault(slot, set())
+        passed = [i for i in indices if i not in taken] if taken else indices
+        for stat_name in STAT_FIELDS:
+            required = getattr(prototype.stat_to_equip, stat_name)
+            column = stats[stat_name]
+            extra = bonus.get(stat_name, None)
+            if extra is None:
+                if (floor := floors.get(stat_name, None)) is None:
+                    floor = floors[stat_name] = min(column, default=0)
+                if required <= floor:
+                    continue
+                passed = [i for i in passed if column[i] >= required]
+            else:
+                passed = [i for i in passed if column[i] + extra.get(i, 0) >= required]
+            if not passed:
+                break
+        taken.update(passed)
+        for i in passed:
+            equipped[i].append(name)
+        for stat_name, value in prototype.stat_on_equip.to_dict().items():
+            if value != 0:
+                extra = bonus.setdefault(stat_name, {})
+                for i in passed:
+                    extra[i] = extra.get(i, 0) + value
+    return equipped
+
+
+def spawn_wave(
+    template: CharacterTemplate,
+    count: int,
+    seed: int | None = None,
+    pool: ItemPool = item_pool,
+) -> Wave:
+    rng = random.Random(seed)
+    stats: dict[str, array] = {}
+    for name in STAT_FIELDS:
+        base = template.stat.get(name, 0)
+        if jitter := template.jitter.get(name, 0):
+            stats[name] = array(
+                "q", (base + rng.randint(-jitter, jitter) for _ in range(count))
+            )
+        else:
+            stats[name] = array("q", [base]) * count
+
+    loadouts = list(template.loadouts)
+    if loadouts:
+        choices = array("H", (rng.randrange(len(loadouts)) for _ in range(count)))
+    else:
+        choices = array("H", [0]) * count
+
+    groups: dict[int, list[int]] = {}
+    for i, choice in enumerate(choices):
+        groups.setdefault(choice, []).append(i)
+    equippable: list[tuple[str, ...]] = [()] * count
+    if loadouts:
+        for choice, indices in groups.items():
+            plan = validate_loadout(stats, indices, loadouts[choice], pool)
+            for i, names in plan.items():
+                equippable[i] = tuple(names)
+    return Wave(template, stats, loadouts, choices, equippable, pool)
@@ -0,0 +1,152 @@
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+from app.base import STAT_FIELDS, Character, Context, Item, Stat
+
+StateKey = tuple
+
+
+def _stat_key(stat: Stat) -> tuple:
+    return tuple(getattr(stat, name) for name in STAT_FIELDS)
+
+
+def _modifier_keys(character: Character) -> dict[int, tuple]:
+    by_source: dict[int, list[tuple]] = {}
+    for stat_name, modifiers in character.modifiers.modifiers.items():
+        for source, modifier in modifiers:
+            by_source.setdefault(id(source), []).append(
+                (stat_name, modifier.value, modifier.layer.value, modifier.priority)
+            )
+    return {source: tuple(sorted(keys)) for source, keys in by_source.items()}
+
+
+def item_key(item: Item, modifiers: tuple = ()) -> tuple:
+    parameters = tuple(sorted(item.parameters().items()))
+    return (
+        type(item).__name__,
+        item.flavor.name,
+        item.can_equip_at,
+        _stat_key(item.stat),
+        item.stacks,
+        item.wear_out_rate,
+        item.is_broken,
+        item.can_attack,
+        item.can_defend,
+        parameters,
+        modifiers,
+    )
+
+
+def character_key(character: Character) -> tuple:
+    modifiers = _modifier_keys(character)
+    flavor = character.flavor
+    return (
+        flavor.name,
+        flavor.category,
+        flavor.sub_category,
+        tuple(sorted(flavor.type)),
+        character.is_player,
+        _stat_key(character.base_stat),
+        character.status_affect.can_stack,
+        modifiers.get(id(character), ()),
+        tuple(
+            sorted(
+                item_key(item, modifiers.get(id(item), ()))
+                for item in character.equipped.group.values()
+            )
+        ),
+        tuple(
+            sorted(
+                item_key(item, modifiers.get(id(item), ()))
+                for item in character.status_affect.group.values()
+            )
+        ),
+    )
+
+
+def canonical_state() -> StateKey:
+    return (
+        Context.current_phase.value,
+        character_key(Context.player),
+        character_key(Context.opponent),
+    )
+
+
+def state_hash() -> int:
+    return hash(canonical_state())
+
+
+def outcome_key(turns_left: int) -> Hashable:
+    return canonical_state(), turns_left
+
+
+class OutcomeDistribution:
+    def __init__(self) -> None:
+        self.counts: dict[Hashable, int] = {}
+        self.samples = 0
+
+    def add(self, outcome: Hashable, count: int = 1):
+        self.counts[outcome] = self.counts.get(outcome, 0) + count
+        self.samples += count
+
+    def merge(self, distribution: "OutcomeDistribution"):
+        for outcome, count in distribution.counts.items():
+            self.add(outcome, count)
+
+    def probability(self, predicate: Callable[[Any], bool]) -> float:
+        if not self.samples:
+            return 0.0
+        matching = sum(c for outcome, c in self.counts.items() if predicate(outcome))
+        return matching / self.samples
+
+    def sample(self, rng: Any) -> Hashable:
+        target = rng.randrange(self.samples)
+        for outcome, count in self.counts.items():
+            target -= count
+            if target < 0:
+                return outcome
+        raise ValueError("Cannot sample an empty distribution")
+
+
+class OutcomeCache:
+    def __init__(self, max_size: int = 100_000, min_samples: int = 16) -> None:
+        self.max_size = max_size
+        self.min_samples = min_samples
+        self.entries: OrderedDict[Hashable, OutcomeDistribution] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.entries
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: Hashable) -> OutcomeDistribution | None:
+        distribution = self.entries.get(key, None)
+        if distribution is not None and distribution.samples >= self.min_samples:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return distribution
+        self.misses += 1
+        return None
+
+    def record(self, key: Hashable, outcome: Hashable):
+        if (distribution := self.entries.get(key, None)) is None:
+            distribution = OutcomeDistribution()
+            self.entries[key] = distribution
+            if len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+        else:
+            self.entries.move_to_end(key)
+        distribution.add(outcome)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
@@ -1,4 +1,5 @@
 from app.base import Character, Item
+from app.modifiers import ModifierLayer, StatModifier
 
 
 class Burning(Item):
@@ -9,6 +10,7 @@ class Burning(Item):
                 "name": "Burning",
                 "description": "On affliction loose 5 health and for next 2 turns, Every turn loose 1 defense and 2 health.",
                 "category": "AFFLICTION",
+                "type": ["FIRE"],
             },
             stat={"health": 2},
             is_status_affect=True,
@@ -16,13 +18,15 @@ class Burning(Item):
 
     def on_apply(self, equip_character: Character):
         super().on_apply(equip_character)
-        equip_character.stat.health -= 5
+        equip_character.take_damage(5)
 
     def on_start_turn_phase(self):
         if self.is_active and self.equipped_by is not None:
-            self.equipped_by.stat.defense -= 1
-            self.equipped_by.stat.health -= 2
+            self.equipped_by.modifiers.add(self, StatModifier("defense", -1))
+            self.equipped_by.take_damage(2)
             self.stat.health -= 1
+        else:
+            self.wear_off()
 
 
 class Freeze(Item):
@@ -33,20 +37,15 @@ class Freeze(Item):
                 "name": "Freeze",
                 "description": "For next 3 turns, Your agility will be 0.",
                 "category": "AFFLICTION",
+                "type": ["ICE"],
             },
             stat={"health": 2},
+            stat_modifiers=[StatModifier("agility", 0, ModifierLayer.OVERRIDE)],
             is_status_affect=True,
         )
-        self.original_agility = 0
-
-    def on_apply(self, equip_character: Character):
-        super().on_apply(equip_character)
-        self.original_agility = equip_character.stat.agility
-        equip_character.stat.agility = 0
 
     def on_start_turn_phase(self):
         if not self.is_active:
-            if self.equipped_by is not None:
-                self.equipped_by.stat.agility = self.original_agility
+            self.wear_off()
         else:
             self.stat.health -= 1
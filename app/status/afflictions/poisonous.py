@@ -16,4 +16,4 @@ class Poisoned(Item):
 
     def on_start_turn_phase(self):
         if self.is_active and self.equipped_by is not None:
-            self.equipped_by.stat.health -= 1
+            self.equipped_by.take_damage(1)
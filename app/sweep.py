@@ -0,0 +1,132 @@
+from concurrent.futures import Executor
+from itertools import product
+from random import Random
+from attr import define, field
+from typing import Any
+
+from app.simulation import BatchResult, Matchup, run_batch
+
+
+@define
+class Parameter:
+    path: str
+    values: list[Any] = field(factory=list)
+    low: float | None = field(default=None)
+    high: float | None = field(default=None)
+    integer: bool = field(default=True)
+
+    def grid_values(self) -> list[Any]:
+        if self.values:
+            return list(self.values)
+        if self.integer and self.low is not None and self.high is not None:
+            return list(range(int(self.low), int(self.high) + 1))
+        raise ValueError(f"Parameter {self.path} needs values for a grid sweep")
+
+    def sample(self, u: float) -> Any:
+        if self.values:
+            return self.values[min(int(u * len(self.values)), len(self.values) - 1)]
+        if self.low is None or self.high is None:
+            raise ValueError(f"Parameter {self.path} needs values or a range")
+        value = self.low + u * (self.high - self.low)
+        return round(value) if self.integer else value
+
+
+def grid(parameters: list[Parameter]) -> list[dict[str, Any]]:
+    return [
+        dict(zip([p.path for p in parameters], values))
+        for values in product(*[p.grid_values() for p in parameters])
+    ]
+
+
+def latin_hypercube(
+    parameters: list[Parameter], samples: int, seed: int = 0
+) -> list[dict[str, Any]]:
+    rng = Random(seed)
+    columns: list[list[float]] = []
+    for _ in parameters:
+        strata = [(i + rng.random()) / samples for i in range(samples)]
+        rng.shuffle(strata)
+        columns.append(strata)
+    return [
+        {p.path: p.sample(column[i]) for p, column in zip(parameters, columns)}
+        for i in range(samples)
+    ]
+
+
+@define
+class SweepPoint:
+    parameters: dict[str, Any]
+    result: BatchResult = field(factory=BatchResult)
+    converged: bool = field(default=False)
+
+    @property
+    def half_width(self) -> float:
+        return self.result.half_width
+
+
+@define
+class SweepResult:
+    points: list[SweepPoint] = field(factory=list)
+
+    @property
+    def battles(self) -> int:
+        return sum(point.result.battles for point in self.points)
+
+    def surface(self, x: str, y: str | None = None) -> dict[Any, float]:
+        surface: dict[Any, BatchResult] = {}
+        for point in self.points:
+            if y is None:
+                key = point.parameters[x]
+            else:
+                key = (point.parameters[x], point.parameters[y])
+            surface.setdefault(key, BatchResult()).merge(point.result)
+        return {key: result.win_rate for key, result in surface.items()}
+
+    def report(self) -> str:
+        lines = []
+        for point in self.points:
+            low, high = point.result.interval
+            parameters = ", ".join(f"{k}={v}" for k, v in point.parameters.items())
+            lines.append(
+                f"{parameters}: win_rate={point.result.win_rate:.3f} "
+                f"[{low:.3f}, {high:.3f}] battles={point.result.battles}"
+            )
+        return "\n".join(lines)
+
+
+def run_sweep(
+    matchup: Matchup,
+    configurations: list[dict[str, Any]],
+    tolerance: float = 0.05,
+    batch_size: int = 50,
+    max_battles: int = 2000,
+    seed: int = 0,
+    max_turns: int = 100,
+    executor: Executor | None = None,
+) -> SweepResult:
+    sweep = SweepResult([SweepPoint(c) for c in configurations])
+    active = list(enumerate(sweep.points))
+    while active:
+        jobs = [
+            (
+                matchup.with_parameters(point.parameters),
+                min(batch_size, max_battles - point.result.battles),
+                seed + i * max_battles + point.result.battles,
+                max_turns,
+            )
+            for i, point in active
+        ]
+        if executor is None:
+            results = [run_batch(*job) for job in jobs]
+        else:
+            results = list(executor.map(run_batch, *zip(*jobs)))
+
+        still_active = []
+        for (i, point), result in zip(active, results):
+            point.result.merge(result)
+            if point.half_width <= tolerance:
+                point.converged = True
+            elif point.result.battles < max_battles:
+                still_active.append((i, point))
+        active = still_active
+    return sweep
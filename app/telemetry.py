@@ -0,0 +1,237 @@
+import os
+import threading
+import time
+from attr import define, field
+from typing import Any
+
+from app.base import Context, Item, Phase
+from app.damage import Hit
+
+METRIC_PREFIX = "battlesim"
+TRACKED_AFFLICTIONS: tuple[str, ...] = ("Burning", "Freeze", "Poisoned")
+
+MetricKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+def metric_key(name: str, labels: dict[str, Any]) -> MetricKey:
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+class MetricShard:
+    def __init__(self) -> None:
+        self.counters: dict[MetricKey, float] = {}
+        self.summaries: dict[MetricKey, list[float]] = {}
+        self.ticks = 0
+
+
+@define
+class MetricsSnapshot:
+    counters: dict[MetricKey, float] = field(factory=dict)
+    summaries: dict[MetricKey, tuple[int, float]] = field(factory=dict)
+    gauges: dict[MetricKey, float] = field(factory=dict)
+
+    def counter(self, name: str, **labels) -> float:
+        return self.counters.get(metric_key(name, labels), 0)
+
+    def summary(self, name: str, **labels) -> tuple[int, float]:
+        return self.summaries.get(metric_key(name, labels), (0, 0.0))
+
+    def mean(self, name: str, **labels) -> float:
+        count, total = self.summary(name, **labels)
+        return total / count if count else 0.0
+
+    def gauge(self, name: str, **labels) -> float:
+        return self.gauges.get(metric_key(name, labels), 0)
+
+
+class Metrics:
+    def __init__(self) -> None:
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.shards: list[MetricShard] = []
+        self.gauges: dict[MetricKey, float] = {}
+
+    def shard(self) -> MetricShard:
+        try:
+            return self.local.shard
+        except AttributeError:
+            shard = MetricShard()
+            with self.lock:
+                self.shards.append(shard)
+            self.local.shard = shard
+            return shard
+
+    def inc(self, name: str, value: float = 1, **labels):
+        counters = self.shard().counters
+        key = metric_key(name, labels)
+        counters[key] = counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels):
+        summaries = self.shard().summaries
+        key = metric_key(name, labels)
+        if (summary := summaries.get(key, None)) is None:
+            summaries[key] = [1, value]
+        else:
+            summary[0] += 1
+            summary[1] += value
+
+    def set_gauge(self, name: str, value: float, **labels):
+        self.gauges[metric_key(name, labels)] = value
+
+    def snapshot(self) -> MetricsSnapshot:
+        snapshot = MetricsSnapshot(gauges=dict(self.gauges))
+        with self.lock:
+            shards = list(self.shards)
+        for shard in shards:
+            for key, value in list(shard.counters.items()):
+                snapshot.counters[key] = snapshot.counters.get(key, 0) + value
+            for key, (count, total) in list(shard.summaries.items()):
+                merged_count, merged_total = snapshot.summaries.get(key, (0, 0))
+                snapshot.summaries[key] = (merged_count + count, merged_total + total)
+        return snapshot
+
+    def reset(self):
+        with self.lock:
+            self.shards.clear()
+            self.gauges.clear()
+        self.local = threading.local()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: tuple[tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels) + "}"
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def to_prometheus(snapshot: MetricsSnapshot, prefix: str = METRIC_PREFIX) -> str:
+    lines: list[str] = []
+    typed: set[str] = set()
+
+    def declare(name: str, kind: str):
+        if name not in typed:
+            typed.add(name)
+            lines.append(f"# TYPE {name} {kind}")
+
+    for (name, labels), value in sorted(snapshot.counters.items()):
+        name = f"{prefix}_{name}_total"
+        declare(name, "counter")
+        lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+    for (name, labels), (count, total) in sorted(snapshot.summaries.items()):
+        name = f"{prefix}_{name}"
+        declare(name, "summary")
+        lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(total)}")
+        lines.append(f"{name}_count{_format_labels(labels)} {count}")
+    for (name, labels), value in sorted(snapshot.gauges.items()):
+        name = f"{prefix}_{name}"
+        declare(name, "gauge")
+        lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+class FileSink:
+    def __init__(self, path: str | os.PathLike, interval: float = 10.0) -> None:
+        self.path = os.fspath(path)
+        self.interval = interval
+        self.written_at: float | None = None
+
+    def write(self, text: str):
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as output:
+            output.write(text)
+        os.replace(temporary, self.path)
+        self.written_at = time.monotonic()
+
+    def is_due(self) -> bool:
+        return (
+            self.written_at is None
+            or time.monotonic() - self.written_at >= self.interval
+        )
+
+
+class BattleTelemetry:
+    def __init__(
+        self,
+        metrics: Metrics | None = None,
+        sample_every: int = 1,
+        sink: FileSink | None = None,
+    ) -> None:
+        if sample_every < 1:
+            raise ValueError("sample_every must be at least 1")
+        self.metrics = metrics if metrics is not None else Metrics()
+        self.sample_every = sample_every
+        self.sink = sink
+        self.started_at = time.perf_counter()
+        self.phase_timer = threading.local()
+
+    def sampled(self) -> bool:
+        shard = self.metrics.shard()
+        shard.ticks += 1
+        return shard.ticks % self.sample_every == 0
+
+    def on_phase(self, phase: Phase):
+        timer = self.phase_timer
+        now = None
+        if (started := getattr(timer, "started", None)) is not None:
+            now = time.perf_counter()
+            self.metrics.observe(
+                "phase_duration_seconds", now - started, phase=timer.phase.value
+            )
+            timer.started = None
+        if phase == Phase.BATTLE_END:
+            self.metrics.inc("battles")
+            self.metrics.observe("battle_turns", max(Context.current_turn - 1, 0))
+            if self.sink is not None and self.sink.is_due():
+                self.export_to_sink()
+        elif self.sampled():
+            timer.phase = phase
+            timer.started = now if now is not None else time.perf_counter()
+
+    def on_attack(self, hit: Hit):
+        self.metrics.inc("hits")
+        if self.sampled():
+            self.metrics.observe("damage_per_hit", hit.damage)
+
+    def on_apply(self, character: Any, item: Item):
+        if item.flavor.name in TRACKED_AFFLICTIONS:
+            self.metrics.inc("affliction_procs", affliction=item.flavor.name)
+
+    def set_queue_depth(self, depth: int):
+        self.metrics.set_gauge("queue_depth", depth)
+
+    def snapshot(self) -> MetricsSnapshot:
+        snapshot = self.metrics.snapshot()
+        elapsed = time.perf_counter() - self.started_at
+        battles = snapshot.counter("battles")
+        hits = snapshot.counter("hits")
+        gauges = snapshot.gauges
+        gauges[metric_key("battles_per_second", {})] = (
+            battles / elapsed if elapsed > 0 else 0.0
+        )
+        gauges[metric_key("mean_turns", {})] = snapshot.mean("battle_turns")
+        for name in TRACKED_AFFLICTIONS:
+            procs = snapshot.counter("affliction_procs", affliction=name)
+            key = metric_key("affliction_proc_rate", {"affliction": name})
+            gauges[key] = procs / hits if hits else 0.0
+        return snapshot
+
+    def export(self) -> str:
+        return to_prometheus(self.snapshot())
+
+    def export_to_sink(self):
+        if self.sink is not None:
+            self.sink.write(self.export())
+
+    def install(self, priority: int = -100) -> "BattleTelemetry":
+        Context.hooks.register_plugin(self, priority)
+        return self
+
+    def uninstall(self):
+        Context.hooks.unregister_plugin(self)
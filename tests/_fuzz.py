@@ -0,0 +1,69 @@
+import os
+import random
+from functools import lru_cache
+from typing import Any, Callable
+from unittest import TestCase
+from app.base import STAT_FIELDS, Character, EquipGroup, Item
+from app.registry import registry
+
+FUZZ_CASES: int = int(os.environ.get("BATTLESIM_FUZZ_CASES", "200"))
+FUZZ_SEED: int = int(os.environ.get("BATTLESIM_FUZZ_SEED", "0"))
+
+EQUIP_SLOTS: tuple[str, ...] = tuple(EquipGroup().equip_slots.keys())
+SWORDS: tuple[str, ...] = tuple(
+    name for name, module in registry.manifest.items() if module.endswith("swords")
+)
+
+
+def random_stat(rng: random.Random, low: int, high: int) -> dict[str, int]:
+    return {name: rng.randint(low, high) for name in STAT_FIELDS}
+
+
+@lru_cache(maxsize=4096)
+def character_spec(seed: int) -> dict[str, Any]:
+    rng = random.Random(seed)
+    stat = random_stat(rng, 0, 40)
+    stat["health"] = rng.randint(1, 80)
+    stat["luck"] = rng.randint(0, 20)
+    return {"flavor": {"name": f"character-{seed}"}, "stat": stat}
+
+
+@lru_cache(maxsize=4096)
+def item_spec(seed: int) -> dict[str, Any]:
+    rng = random.Random(seed)
+    return {
+        "flavor": {"name": f"item-{seed}"},
+        "stat": random_stat(rng, 0, 20) | {"health": rng.randint(1, 20)},
+        "stat_on_equip": random_stat(rng, -10, 10),
+        "stat_to_equip": {},
+        "can_equip_at": rng.choice(EQUIP_SLOTS),
+        "can_equip": True,
+        "can_unequip": True,
+        "can_attack": rng.random() < 0.7,
+        "can_defend": rng.random() < 0.5,
+        "wear_out_rate": rng.randint(1, 3),
+    }
+
+
+def random_character(rng: random.Random) -> Character:
+    return Character(**character_spec(rng.randrange(4096)))
+
+
+def random_item(rng: random.Random) -> Item:
+    if rng.random() < 0.3:
+        return registry.create(rng.choice(SWORDS))
+    return Item(**item_spec(rng.randrange(4096)))
+
+
+def for_all(
+    test: TestCase,
+    check: Callable[[random.Random], None],
+    cases: int = FUZZ_CASES,
+    seed: int = FUZZ_SEED,
+):
+    for case in range(seed, seed + cases):
+        random.seed(case)
+        try:
+            check(random.Random(case))
+        except AssertionError as e:
+            test.fail(f"{check.__name__} failed for case seed {case}: {e}")
@@ -87,3 +87,22 @@ class TestSwords(TestCase):
         sword.ice_bolt_freeze_probability = 100
         sword.perform_action("shoot_ice_bolts")
         self.assertEqual(sword.stat.health, 8)
+
+    def test_item_actions_merged_into_character(self):
+        Context.current_phase = Phase.PLAYER_ATTACK_START
+        self.assertNotIn("shoot_ice_bolts", self.player.get_available_actions())
+
+        sword = FrostSword()
+        self.player.equip(sword)
+        actions = self.player.get_available_actions()
+        self.assertEqual(actions["shoot_ice_bolts"], sword.shoot_ice_bolts)
+        self.assertEqual(
+            actions["perform_item_attack"], self.player.perform_item_attack
+        )
+        self.assertIs(self.player.get_available_actions(), actions)
+
+        self.player.perform_action("shoot_ice_bolts")
+        self.assertEqual(sword.stat.health, 12)
+
+        Context.current_phase = Phase.OPPONENT_ATTACK_START
+        self.assertEqual(self.player.get_available_actions(), {})
@@ -72,3 +72,17 @@ class TestTurnBasedAfflictions(TestCase):
         for _ in range(6):
             self.battle.switch_to_phase(Phase.TURN_START)
         self.assertEqual(self.player.stat.agility, 100)
+
+    def test_Freeze_twice(self):
+        self.player.status_affect.can_stack = True
+        status1, status2 = Freeze(), Freeze()
+
+        self.assertEqual(self.player.apply(status1), status1)
+        self.battle.switch_to_phase(Phase.TURN_START)
+        self.assertEqual(self.player.apply(status2), status1)
+        self.assertEqual(self.player.stat.agility, 0)
+        for _ in range(3):
+            self.battle.switch_to_phase(Phase.TURN_START)
+        self.assertEqual(self.player.stat.agility, 0)
+        self.battle.switch_to_phase(Phase.TURN_START)
+        self.assertEqual(self.player.stat.agility, 100)
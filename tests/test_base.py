@@ -79,3 +79,82 @@ class TestCharacter(TestCase):
         self.assertEqual(self.player.equip(self.item1), self.item1)
         self.assertEqual(Context.current_phase, Phase.BATTLE_START)
         self.battle.run_phase_action()
+
+    def test_effective_stat(self):
+        self.assertEqual(self.player.equip(self.item1), self.item1)
+        self.assertEqual(self.player.base_stat.to_dict(), TEST_INPUT["player"]["stat"])
+        self.assertEqual(
+            self.player.stat.to_dict(),
+            (
+                Stat(**TEST_INPUT["player"]["stat"])
+                + Stat(**TEST_INPUT["item"]["stat_on_equip"])
+            ).to_dict(),
+        )
+        self.assertEqual(self.player.dirty_stats, set())
+
+        self.player.take_damage(5)
+        self.assertEqual(self.player.base_stat.health, 5)
+        self.assertEqual(self.player.stat.health, 6)
+
+        self.assertEqual(self.player.unequip(self.item1), self.item1)
+        self.assertNotEqual(self.player.dirty_stats, set())
+        self.assertEqual(self.player.stat.health, 5)
+        self.assertEqual(self.player.stat.attack, 20)
+        self.assertEqual(self.player.dirty_stats, set())
+
+
+class TestActionRegistry(TestCase):
+    def test_class_actions(self):
+        class Caster(Character):
+            @action(Phase.PLAYER_ATTACK_START, Phase.TURN_START)
+            def cast(self, **kwargs):
+                pass
+
+            @action(Phase.TURN_END, action_name="rest")
+            def sleep(self, **kwargs):
+                pass
+
+        self.assertEqual(
+            Caster.class_actions_by_phase[Phase.PLAYER_ATTACK_START],
+            {"perform_item_attack": "perform_item_attack", "cast": "cast"},
+        )
+        self.assertEqual(Caster.class_actions["rest"], ([Phase.TURN_END], "sleep"))
+        self.assertNotIn("cast", Character.class_actions)
+
+        caster = Caster()
+        self.assertEqual(
+            caster.compile_actions(Phase.TURN_START), {"cast": caster.cast}
+        )
+        caster.register_action("shout", [Phase.TURN_START], caster.sleep)
+        self.assertEqual(
+            caster.compile_actions(Phase.TURN_START),
+            {"cast": caster.cast, "shout": caster.sleep},
+        )
+        self.assertEqual(caster.get_action("rest"), caster.sleep)
+
+
+class TestBattle(TestCase):
+    def setUp(self) -> None:
+        Context.current_phase = Phase.BATTLE_NOT_STARTED
+        self.player: Character | None = Character(**TEST_INPUT["player"])
+        self.opponent: Character | None = Character(**TEST_INPUT["opponent"])
+        self.battle: Battle | None = Battle(self.player, self.opponent)
+
+    def tearDown(self) -> None:
+        self.player = None
+        self.opponent = None
+        self.battle = None
+
+    def test_run(self):
+        item = Item(**TEST_INPUT["item"])
+        self.player.equip(item)
+        self.assertEqual(self.battle.run(), self.player)
+        self.assertEqual(self.battle.winner, self.player)
+        self.assertEqual(self.battle.turns_played, 1)
+        self.assertEqual(Context.current_phase, Phase.BATTLE_END)
+        self.assertEqual(item.stat.health, 10)
+
+    def test_run_max_turns(self):
+        self.assertIsNone(self.battle.run(max_turns=5))
+        self.assertEqual(self.battle.turns_played, 5)
+        self.assertFalse(self.battle.is_over)
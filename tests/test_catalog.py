@@ -0,0 +1,45 @@
+from concurrent.futures import ProcessPoolExecutor
+from unittest import TestCase
+from app import catalog
+from app.catalog import *
+from app.items.weapons.swords import FlameSword
+from app.registry import registry
+
+
+def read_from_worker(name: str) -> tuple[str, int, str]:
+    sword = catalog.current_items().create(name)
+    items = catalog.current_items()
+    return (type(items).__name__, sword.stat.attack, sword.flavor.name)
+
+
+class TestCatalog(TestCase):
+    def test_encode(self):
+        sword = FlameSword()
+        sword.stat.attack = 99
+        items = Catalog(encode_catalog([sword]))
+        self.assertIn("FlameSword", items)
+        self.assertEqual(len(items), 1)
+
+        copy1, copy2 = items.create("FlameSword"), items.create("FlameSword")
+        self.assertIsInstance(copy1, FlameSword)
+        self.assertIsNot(copy1, copy2)
+        self.assertEqual(copy1.stat.attack, 99)
+        self.assertEqual(copy1.flavor, sword.flavor)
+        with self.assertRaises(KeyError):
+            items.create("Unknown")
+        with self.assertRaises(ValueError):
+            Catalog(b"JUNK" + bytes(8))
+
+    def test_shared(self):
+        with SharedCatalog.publish() as published:
+            self.assertEqual(sorted(published), sorted(registry))
+            attached = SharedCatalog.attach(published.name)
+            self.assertEqual(attached.create("IronSword").stat.attack, 12)
+            attached.close()
+
+            with ProcessPoolExecutor(
+                2, initializer=attach_worker_catalog, initargs=(published.name,)
+            ) as executor:
+                results = list(executor.map(read_from_worker, ["FlameSword"] * 4))
+        self.assertEqual(results, [("SharedCatalog", 5, "FlameSword")] * 4)
+        self.assertIs(current_items(), registry)
@@ -0,0 +1,84 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+from tests.test_simulation import SWORDSMAN
+from tests._artifacts import *
+from app.base import *
+from app.pool import *
+from app.simulation import *
+
+
+class TestThreadSafety(TestCase):
+    def setUp(self) -> None:
+        Context.current_phase = Phase.BATTLE_NOT_STARTED
+        self.matchup = Matchup(
+            player={
+                "flavor": TEST_INPUT["player"]["flavor"],
+                "stat": TEST_INPUT["player"]["stat"] | {"health": 80},
+            },
+            opponent=SWORDSMAN | {"stat": SWORDSMAN["stat"] | {"health": 80}},
+            player_items=["FlameSword"],
+            opponent_items=["FrostSword"],
+        )
+
+    def test_no_shared_defaults(self):
+        first, second = FlavorStat(), FlavorStat()
+        first.type.append("UNDEAD")
+        self.assertEqual(second.type, [])
+        self.assertIsInstance(Item().stat_modifiers, tuple)
+
+    def test_context_is_per_thread(self):
+        barrier = threading.Barrier(2)
+        seen: dict[str, str] = {}
+
+        def enter(name: str):
+            Battle(Character(flavor={"name": name}), Character())
+            barrier.wait()
+            seen[name] = Context.player.flavor.name
+
+        threads = [threading.Thread(target=enter, args=(n,)) for n in ("a", "b")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(seen, {"a": "a", "b": "b"})
+
+    def test_pool_free_lists_are_per_thread(self):
+        pool = ItemPool()
+        burning = pool.acquire("Burning")
+        pool.release(burning)
+        with ThreadPoolExecutor(1) as executor:
+            other = executor.submit(pool.acquire, "Burning").result()
+        self.assertIsNot(other, burning)
+        self.assertIs(other.flavor, burning.flavor)
+        self.assertIs(pool.acquire("Burning"), burning)
+
+    def test_shared_prototype_parts_are_immutable(self):
+        pool = ItemPool()
+        prototype = pool.prototype("Freeze")
+
+        def tamper(item: Item):
+            item.flavor.type.append("FIRE")
+
+        with ThreadPoolExecutor(1) as executor:
+            future = executor.submit(tamper, pool.acquire("Freeze"))
+            self.assertRaises(AttributeError, future.result)
+        self.assertEqual(prototype.flavor.type, ("ICE",))
+        self.assertIsInstance(prototype.stat_to_equip, SharedStat)
+        self.assertIsInstance(prototype.stat_modifiers[0], StatModifier)
+        with self.assertRaises(AttributeError):
+            prototype.stat_modifiers[0].value = 100
+
+    def test_threaded_batch_matches_serial(self):
+        serial = [run_battle(self.matchup, seed) for seed in range(200)]
+        with ThreadPoolExecutor(8) as executor:
+            for _ in range(3):
+                threaded = list(
+                    executor.map(run_battle, [self.matchup] * 200, range(200))
+                )
+                self.assertEqual(threaded, serial)
+
+        self.assertEqual(
+            run_batch_threaded(self.matchup, 200, seed=5, workers=8),
+            run_batch(self.matchup, 200, seed=5),
+        )
@@ -0,0 +1,92 @@
+import gc
+import weakref
+from unittest import TestCase
+from tests._artifacts import *
+from app.base import *
+from app.damage import *
+
+
+class TestDamagePipeline(TestCase):
+    def setUp(self) -> None:
+        Context.current_phase = Phase.BATTLE_NOT_STARTED
+        self.player: Character | None = Character(**TEST_INPUT["player"])
+        self.opponent: Character | None = Character(**TEST_INPUT["opponent"])
+        self.battle: Battle | None = Battle(self.player, self.opponent)
+        self.pipeline = DamagePipeline.default()
+
+    def tearDown(self) -> None:
+        self.player = None
+        self.opponent = None
+        self.battle = None
+
+    def test_default_stages(self):
+        self.assertEqual(
+            self.pipeline.stage_names,
+            ["crit", "elemental", "armor", "resistance", "clamp"],
+        )
+
+    def test_resolve(self):
+        hit = Hit(self.player, self.opponent, attack=15, bonus=20)
+        self.assertEqual(self.pipeline.resolve(hit), 15 + 20 - 29)
+
+        hit = Hit(self.player, self.opponent, attack=15, bonus=20, is_crit=True)
+        self.assertEqual(self.pipeline.resolve(hit), 15 * 2 + 20 - 29)
+
+        hit = Hit(self.player, self.opponent, attack=1)
+        self.assertEqual(self.pipeline.resolve(hit), 0)
+
+    def test_compiled_is_cached_until_invalidated(self):
+        compiled = self.pipeline.get_compiled(self.player, self.opponent)
+        self.assertIs(self.pipeline.get_compiled(self.player, self.opponent), compiled)
+
+        item = Item(**TEST_INPUT["item"])
+        item.character_can_equip = lambda char: True
+        self.assertEqual(self.opponent.equip(item), item)
+        recompiled = self.pipeline.get_compiled(self.player, self.opponent)
+        self.assertIsNot(recompiled, compiled)
+
+        hit = Hit(self.player, self.opponent, attack=100, bonus=20)
+        self.assertEqual(self.pipeline.resolve(hit), 100 + 20 - (29 + 3) - 33)
+
+        self.pipeline.register_stage("noop", lambda a, d: None, 250)
+        self.assertIsNot(
+            self.pipeline.get_compiled(self.player, self.opponent), recompiled
+        )
+
+    def test_compiled_does_not_keep_old_defenders(self):
+        defenders = []
+        for _ in range(50):
+            defender = Character(**TEST_INPUT["opponent"])
+            defenders.append(weakref.ref(defender))
+            Battle(self.player, defender)
+            self.pipeline.resolve(Hit(self.player, defender, attack=10))
+            defender = None
+        gc.collect()
+        self.assertLessEqual(sum(ref() is not None for ref in defenders), 1)
+
+    def test_item_modifiers(self):
+        item = Item(**TEST_INPUT["item"])
+        self.player.equip(item)
+        hit = Hit(self.player, self.opponent, attack=10, bonus=20)
+        self.assertEqual(self.pipeline.resolve(hit), 10 + 20 - 29)
+
+        def double(hit: Hit):
+            hit.damage *= 2
+
+        item.register_damage_modifier("elemental", double)
+        hit = Hit(self.player, self.opponent, attack=10, bonus=20)
+        self.assertEqual(self.pipeline.resolve(hit), (10 + 20) * 2 - 29)
+
+        def resist(hit: Hit):
+            hit.damage //= 2
+
+        shield = Item(**TEST_INPUT["item"])
+        shield.flavor.name = "shield"
+        shield.register_damage_modifier("resistance", resist, defensive=True)
+        shield.character_can_equip = lambda char: True
+        shield.can_equip_at = "HAND2"
+        self.opponent.equip(shield)
+        hit = Hit(self.player, self.opponent, attack=100, bonus=20)
+        self.assertEqual(
+            self.pipeline.resolve(hit), ((100 + 20) * 2 - (29 + 3) - 33) // 2
+        )
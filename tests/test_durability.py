@@ -0,0 +1,112 @@
+from unittest import TestCase
+from tests._artifacts import *
+from app.base import *
+from app.durability import *
+from app.items.weapons.swords import FlameSword, IronSword, RustedSword
+
+
+class BreakRecorder:
+    def __init__(self) -> None:
+        self.broken: list[Item] = []
+
+    def on_break(self, item: Item):
+        self.broken.append(item)
+
+
+class TestDurabilityTracker(TestCase):
+    def setUp(self) -> None:
+        Context.current_phase = Phase.BATTLE_NOT_STARTED
+        self.player: Character | None = Character(**TEST_INPUT["player"])
+        self.opponent: Character | None = Character(**TEST_INPUT["opponent"])
+        self.battle: Battle | None = Battle(self.player, self.opponent)
+        self.recorder = BreakRecorder()
+        Context.hooks.register_plugin(self.recorder)
+
+    def tearDown(self) -> None:
+        Context.hooks.unregister_plugin(self.recorder)
+        self.player = None
+        self.opponent = None
+        self.battle = None
+
+    def test_index(self):
+        tracker = DurabilityTracker()
+        swords = [RustedSword(), IronSword(), FlameSword()]
+        for sword in swords:
+            tracker.track(sword)
+        self.assertEqual(len(tracker), 3)
+        self.assertEqual(tracker.below(14), [swords[0], swords[2]])
+        self.assertEqual(tracker.attackable.keys(), tracker.live.keys())
+
+        tracker.untrack(swords[0])
+        self.assertEqual(tracker.below(14), [swords[2]])
+        self.assertIsNone(swords[0].tracker)
+
+    def test_break_once_and_stop_routing(self):
+        sword = RustedSword()
+        self.player.equip(sword)
+        for _ in range(7):
+            sword.wear_out()
+        self.assertTrue(sword.is_broken)
+        self.assertEqual(self.recorder.broken, [sword])
+        self.assertEqual(self.player.equipped.get_attackable_items(), {})
+        self.assertEqual(self.player.equipped.durability.broken, {"RustedSword": sword})
+
+        health = self.opponent.stat.health
+        self.player.perform_item_attack()
+        self.assertEqual(self.opponent.stat.health, health)
+
+    def test_broken_armor_stops_defending(self):
+        armor = Item(**TEST_INPUT["item"])
+        armor.can_attack = False
+        self.player.equip(armor)
+        self.assertEqual(self.player.defense_by_equipment, 33)
+        for _ in range(11):
+            self.player.wear_out_defendables()
+        self.assertEqual(armor.stat.health, 0)
+        self.assertEqual(self.player.defense_by_equipment, 0)
+        self.player.wear_out_defendables()
+        self.assertEqual(armor.stat.health, 0)
+        self.assertEqual(self.recorder.broken, [armor])
+
+    def test_track_broken_item(self):
+        sword = IronSword()
+        sword.stat.health = 0
+        self.player.equip(sword)
+        self.assertTrue(sword.is_broken)
+        self.assertEqual(self.player.equipped.durability.broken, {"IronSword": sword})
+        self.assertEqual(self.recorder.broken, [])
+
+        self.player.equipped.repair()
+        self.assertFalse(sword.is_broken)
+
+    def test_bulk_repair(self):
+        swords = [RustedSword(), IronSword()]
+        swords[1].can_equip_at = "HAND2"
+        for sword in swords:
+            self.player.equip(sword)
+            while not sword.is_broken:
+                sword.wear_out()
+
+        self.player.equipped.repair(amount=3, only_broken=True)
+        self.assertEqual([s.stat.health for s in swords], [3, 3])
+        self.assertFalse(any(s.is_broken for s in swords))
+        self.assertEqual(len(self.player.equipped.get_attackable_items()), 2)
+
+        self.player.equipped.repair()
+        self.assertEqual([s.stat.health for s in swords], [5, 20])
+        self.assertEqual(self.recorder.broken, swords)
+
+    def test_broken_armor_stops_reducing_damage(self):
+        armor = Item(**TEST_INPUT["item"])
+        armor.can_attack = False
+        self.player.equip(armor)
+        resolve = Context.damage_pipeline.resolve
+        armored = resolve(Hit(self.opponent, self.player, 100))
+
+        while not armor.is_broken:
+            armor.wear_out()
+        self.assertEqual(self.player.defense_by_equipment, 0)
+        self.assertEqual(resolve(Hit(self.opponent, self.player, 100)), armored + 33)
+
+        self.player.equipped.repair()
+        self.assertEqual(resolve(Hit(self.opponent, self.player, 100)), armored)
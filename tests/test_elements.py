@@ -0,0 +1,89 @@
+from unittest import TestCase
+from tests._artifacts import *
+from app.base import *
+from app.elements import *
+from app.items.weapons.swords import FlameSword, FrostSword
+from app.status.afflictions.elemental import Burning, Freeze
+
+
+class TestInteractionMatrix(TestCase):
+    def test_growth(self):
+        matrix = InteractionMatrix()
+        matrix.set_crit("FIRE", "UNDEAD")
+        matrix.set_multiplier("FIRE", "ICE", 1.5)
+        for i in range(40):
+            matrix.set_multiplier(f"ELEMENT{i}", "UNDEAD", 1 + i / 10)
+        self.assertEqual(len(matrix), 43)
+        self.assertGreaterEqual(matrix.stride, 43)
+
+        fire, undead, ice = (matrix.ids[n] for n in ("FIRE", "UNDEAD", "ICE"))
+        self.assertTrue(matrix.is_crit([fire], [undead]))
+        self.assertFalse(matrix.is_crit([ice], [undead]))
+        self.assertEqual(matrix.multiplier([fire], [ice, undead]), 1.5)
+        self.assertEqual(matrix.multiplier([matrix.ids["ELEMENT39"]], [undead]), 4.9)
+
+    def test_kinds(self):
+        flavor = FlavorStat(category="UNDEAD", sub_category="GHOST", type=["ICE", "X"])
+        self.assertEqual(
+            elements.kinds(flavor), (elements.ids["UNDEAD"], elements.ids["ICE"])
+        )
+        self.assertNotIn("X", elements.ids)
+
+
+class TestElementalCombat(TestCase):
+    def setUp(self) -> None:
+        Context.current_phase = Phase.BATTLE_NOT_STARTED
+        self.player: Character | None = Character(**TEST_INPUT["player"])
+        self.opponent: Character | None = Character()
+        self.battle: Battle | None = Battle(self.player, self.opponent)
+
+    def tearDown(self) -> None:
+        self.player = None
+        self.opponent = None
+        self.battle = None
+
+    def test_crit_on_creature_type(self):
+        sword = FlameSword()
+        self.player.equip(sword)
+        self.assertFalse(sword.character_can_crit())
+        self.opponent.flavor.type = ["UNDEAD"]
+        self.assertTrue(sword.character_can_crit())
+        self.assertFalse(FrostSword().character_can_crit())
+
+    def test_elemental_damage(self):
+        sword = FlameSword()
+        self.player.equip(sword)
+        base = Context.damage_pipeline.resolve(sword.get_hit(self.opponent))
+
+        self.opponent.flavor.type = ["ICE"]
+        self.assertEqual(
+            Context.damage_pipeline.resolve(sword.get_hit(self.opponent)),
+            int(base * 1.5),
+        )
+        self.opponent.flavor.type.remove("ICE")
+        self.opponent.flavor.type.append("FIRE")
+        self.assertEqual(
+            Context.damage_pipeline.resolve(sword.get_hit(self.opponent)),
+            int(base * 0.5),
+        )
+
+    def test_burning_thaws_freeze(self):
+        agility = self.player.stat.agility
+        self.player.apply(Freeze())
+        self.assertEqual(self.player.stat.agility, 0)
+        self.player.apply(Burning())
+        self.assertNotIn("Freeze", self.player.status_affect.group)
+        self.assertIn("Burning", self.player.status_affect.group)
+        self.assertEqual(self.player.stat.agility, agility)
+
+        self.player.apply(Freeze())
+        self.assertEqual(set(self.player.status_affect.group), {"Burning", "Freeze"})
+
+    def test_stacked_burning_thaws_freeze(self):
+        self.player.status_affect.can_stack = True
+        burning = Burning()
+        self.player.apply(burning)
+        self.player.apply(Freeze())
+        self.assertIs(self.player.apply(Burning()), burning)
+        self.assertEqual(burning.stacks, 2)
+        self.assertNotIn("Freeze", self.player.status_affect.group)
@@ -0,0 +1,47 @@
+import random
+from math import isnan
+from statistics import mean, variance
+from unittest import TestCase
+from app.estimators import *
+
+
+class TestEstimators(TestCase):
+    def test_wilson_interval(self):
+        self.assertEqual(wilson_interval(0, 0), (0.0, 1.0))
+        low, high = wilson_interval(50, 100)
+        self.assertAlmostEqual(low, 0.4038, places=4)
+        self.assertAlmostEqual(high, 0.5962, places=4)
+        self.assertAlmostEqual(wilson_interval(10, 10)[1], 1.0)
+
+    def test_running_stats(self):
+        rng = random.Random(0)
+        values = [rng.gauss(10, 3) for _ in range(500)]
+        stats, left, right = RunningStats(), RunningStats(), RunningStats()
+        for i, value in enumerate(values):
+            stats.add(value)
+            (left if i < 200 else right).add(value)
+        self.assertAlmostEqual(stats.mean, mean(values))
+        self.assertAlmostEqual(stats.variance, variance(values))
+
+        left.merge(right)
+        self.assertEqual(left.count, 500)
+        self.assertAlmostEqual(left.mean, stats.mean)
+        self.assertAlmostEqual(left.variance, stats.variance)
+        self.assertEqual(RunningStats().stderr, inf)
+
+    def test_quantile_sketch(self):
+        sketch = QuantileSketch()
+        self.assertTrue(isnan(sketch.median))
+        for value in range(1, 101):
+            sketch.add(value)
+        self.assertEqual(sketch.median, 50)
+        self.assertEqual(sketch.quantile(0.9), 90)
+        self.assertEqual(sketch.quantile(1.0), 100)
+
+        other = QuantileSketch()
+        other.add(1000)
+        sketch.merge(other)
+        self.assertEqual(sketch.count, 101)
+        self.assertEqual(sketch.quantile(1.0), 1000)
+        with self.assertRaises(ValueError):
+            sketch.merge(QuantileSketch(resolution=5))
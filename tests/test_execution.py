@@ -0,0 +1,108 @@
+import random
+from unittest import TestCase
+from tests._artifacts import *
+from app.base import *
+from app.execution import *
+from app.items.weapons.swords import FlameSword, IronSword
+
+STONEWALL: dict[str, Any] = {
+    "flavor": {"name": "stonewall"},
+    "stat": {"health": 10, "attack": 1, "defense": 50, "agility": 100},
+}
+
+
+class TestBattleRunner(TestCase):
+    def setUp(self) -> None:
+        Context.current_phase = Phase.BATTLE_NOT_STARTED
+        self.player: Character | None = Character(**STONEWALL)
+        self.opponent: Character | None = Character(**STONEWALL)
+        self.battle: Battle | None = Battle(self.player, self.opponent)
+
+    def tearDown(self) -> None:
+        self.player = None
+        self.opponent = None
+        self.battle = None
+
+    def test_max_turns(self):
+        result = BattleRunner(self.battle, ExecutionBudget(max_turns=7)).run()
+        self.assertEqual(result.reason, StopReason.MAX_TURNS)
+        self.assertTrue(result.is_stalemate)
+        self.assertIsNone(result.winner)
+        self.assertEqual(result.turns, 7)
+        self.assertIsNotNone(result.checkpoint)
+        self.assertEqual(Context.current_phase, Phase.BATTLE_END)
+
+    def test_operation_budget(self):
+        budget = ExecutionBudget(max_turns=None, max_operations=20)
+        result = BattleRunner(self.battle, budget).run()
+        self.assertEqual(result.reason, StopReason.OPERATION_BUDGET)
+        self.assertGreaterEqual(result.operations, 20)
+
+    def test_time_budget(self):
+        budget = ExecutionBudget(max_turns=None, max_seconds=0.0)
+        result = BattleRunner(self.battle, budget).run()
+        self.assertEqual(result.reason, StopReason.TIME_BUDGET)
+        self.assertEqual(result.turns, 0)
+
+    def test_finished(self):
+        player = Character(**TEST_INPUT["player"])
+        player.equip(IronSword())
+        battle = Battle(player, Character(stat={"health": 50}))
+        result = BattleRunner(battle).run()
+        self.assertEqual(result.reason, StopReason.FINISHED)
+        self.assertIs(result.winner, player)
+        self.assertIsNone(result.checkpoint)
+
+    def test_checkpoint_resume(self):
+        def fighter() -> Character:
+            character = Character(
+                flavor={"name": "fighter"},
+                stat={"health": 200, "attack": 3, "strength": 20, "agility": 50},
+            )
+            character.equip(IronSword())
+            return character
+
+        random.seed(11)
+        checkpoints: list[Checkpoint] = []
+        full = BattleRunner(
+            Battle(fighter(), fighter()),
+            checkpoint_every=3,
+            on_checkpoint=checkpoints.append,
+        ).run()
+        self.assertEqual(full.reason, StopReason.FINISHED)
+        self.assertEqual(len(checkpoints), full.turns // 3)
+
+        resumed = BattleRunner.resume(checkpoints[1]).run()
+        self.assertEqual(resumed.reason, StopReason.FINISHED)
+        self.assertEqual(resumed.turns, full.turns)
+        self.assertEqual(resumed.operations, full.operations)
+        self.assertEqual(resumed.winner.is_player, full.winner.is_player)
+        self.assertEqual(resumed.winner.stat.to_dict(), full.winner.stat.to_dict())
+
+    def test_checkpoint_resume_parameters(self):
+        def fighter(sword: Item) -> Character:
+            character = Character(
+                flavor={"name": "fighter"},
+                stat={"health": 200, "strength": 20, "intelligence": 10, "agility": 50},
+            )
+            character.equip(sword)
+            return character
+
+        for seed in range(5):
+            sword = FlameSword()
+            sword.burning_probability = 100
+            checkpoints: list[Checkpoint] = []
+            full = BattleRunner(
+                Battle(fighter(sword), fighter(IronSword()), random.Random(seed)),
+                checkpoint_every=2,
+                on_checkpoint=checkpoints.append,
+            ).run()
+
+            battle = checkpoints[0].restore()
+            sword = Context.player.equipped.group["FlameSword"]
+            self.assertEqual(sword.burning_probability, 100)
+            resumed = BattleRunner(battle, started=True).run()
+            self.assertEqual(resumed.turns, full.turns)
+            self.assertEqual(
+                resumed.winner.stat.to_dict(), full.winner.stat.to_dict()
+            )
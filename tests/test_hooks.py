@@ -0,0 +1,87 @@
+from unittest import TestCase
+from tests._artifacts import *
+from app.base import *
+from app.hooks import *
+from app.status.afflictions.elemental import Burning
+from app.status.afflictions.poisonous import Poisoned
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.events: list[tuple] = []
+
+    def on_damage(self, character: Character, damage: int):
+        self.events.append(("on_damage", character, damage))
+
+    def on_apply(self, character: Character, item: Item):
+        self.events.append(("on_apply", character, item))
+
+    def on_turn(self, turn: int):
+        self.events.append(("on_turn", turn))
+
+
+class TestHookBus(TestCase):
+    def setUp(self) -> None:
+        self.hooks = HookBus()
+
+    def test_no_subscribers(self):
+        for event in HOOK_EVENTS:
+            self.assertEqual(getattr(self.hooks, event), ())
+        with self.assertRaises(ValueError):
+            self.hooks.subscribe("on_unknown", print)
+
+    def test_priority(self):
+        calls: list[str] = []
+        self.hooks.subscribe("on_damage", lambda *a: calls.append("low"), -1)
+        self.hooks.subscribe("on_damage", lambda *a: calls.append("first"))
+        self.hooks.subscribe("on_damage", lambda *a: calls.append("high"), 10)
+        self.hooks.subscribe("on_damage", lambda *a: calls.append("second"))
+        self.hooks.emit("on_damage", None, 1)
+        self.assertEqual(calls, ["high", "first", "second", "low"])
+
+        self.hooks.clear()
+        self.assertEqual(self.hooks.on_damage, ())
+
+
+class TestBattleHooks(TestCase):
+    def setUp(self) -> None:
+        Context.current_phase = Phase.BATTLE_NOT_STARTED
+        self.player: Character | None = Character(**TEST_INPUT["player"])
+        self.opponent: Character | None = Character(**TEST_INPUT["opponent"])
+        self.battle: Battle | None = Battle(self.player, self.opponent)
+        self.recorder = Recorder()
+        Context.hooks.register_plugin(self.recorder)
+
+    def tearDown(self) -> None:
+        Context.hooks.unregister_plugin(self.recorder)
+        self.player = None
+        self.opponent = None
+        self.battle = None
+
+    def test_plugin(self):
+        status = Poisoned()
+        self.player.apply(status)
+        self.battle.switch_to_phase(Phase.BATTLE_START)
+        self.battle.switch_to_phase(Phase.TURN_START)
+        self.player.take_damage(0)
+        self.player.take_damage(3)
+        self.assertEqual(
+            self.recorder.events,
+            [
+                ("on_apply", self.player, status),
+                ("on_turn", 1),
+                ("on_damage", self.player, 1),
+                ("on_damage", self.player, 3),
+            ],
+        )
+        Context.hooks.unregister_plugin(self.recorder)
+        self.assertEqual(Context.hooks.on_damage, ())
+
+    def test_damage_over_time(self):
+        status = Burning()
+        self.player.apply(status)
+        self.battle.switch_to_phase(Phase.TURN_START)
+        damage = [e for e in self.recorder.events if e[0] == "on_damage"]
+        self.assertEqual(
+            damage, [("on_damage", self.player, 5), ("on_damage", self.player, 2)]
+        )
@@ -0,0 +1,98 @@
+import random
+from unittest import TestCase
+from tests._fuzz import *
+from app.base import *
+from app.execution import BattleRunner, ExecutionBudget
+from app.status.afflictions.elemental import Burning, Freeze
+from app.status.afflictions.poisonous import Poisoned
+
+
+class WearOutRecorder:
+    def __init__(self) -> None:
+        self.health: dict[int, int] = {}
+        self.violations: list[str] = []
+
+    def on_wear_out(self, item: Item):
+        previous = self.health.get(id(item), None)
+        if previous is not None and item.stat.health > previous:
+            self.violations.append(f"{previous} -> {item.stat.health}")
+        self.health[id(item)] = item.stat.health
+
+
+class TestCombatInvariants(TestCase):
+    def setUp(self) -> None:
+        Context.current_phase = Phase.BATTLE_NOT_STARTED
+
+    def test_unequip_reverses_equip(self):
+        def unequip_reverses_equip(rng: random.Random):
+            character = random_character(rng)
+            items = [Item(**item_spec(rng.randrange(4096))) for _ in range(3)]
+            before = character.stat.to_dict()
+            equipped = [item for item in items if character.equip(item) is not None]
+            for item in reversed(equipped):
+                self.assertIs(character.unequip(item), item)
+            self.assertEqual(character.stat.to_dict(), before)
+            self.assertEqual(character.base_stat.to_dict(), before)
+
+        for_all(self, unequip_reverses_equip)
+
+    def test_wear_out_never_increases_durability(self):
+        recorder = WearOutRecorder()
+
+        def wear_out_never_increases_durability(rng: random.Random):
+            recorder.health.clear()
+            player, opponent = random_character(rng), random_character(rng)
+            for character in (player, opponent):
+                character.stat.strength = character.stat.intelligence = 99
+                for _ in range(2):
+                    character.equip(random_item(rng))
+            items = list(player.equipped.group.values())
+            items += list(opponent.equipped.group.values())
+            durability = [item.stat.health for item in items]
+
+            BattleRunner(Battle(player, opponent), ExecutionBudget(max_turns=30)).run()
+            for item, health in zip(items, durability):
+                self.assertLessEqual(item.stat.health, health)
+            self.assertEqual(recorder.violations, [])
+
+        Context.hooks.register_plugin(recorder)
+        try:
+            for_all(self, wear_out_never_increases_durability)
+        finally:
+            Context.hooks.unregister_plugin(recorder)
+
+    def test_freeze_restores_agility(self):
+        def freeze_restores_agility(rng: random.Random):
+            player, opponent = random_character(rng), random_character(rng)
+            battle = Battle(player, opponent)
+            player.status_affect.can_stack = rng.random() < 0.5
+            agility = player.stat.agility
+            freezes = [Freeze() for _ in range(rng.randint(1, 3))]
+            others = [rng.choice([Burning, Poisoned])() for _ in range(2)]
+            for status in rng.sample(freezes + others, len(freezes + others)):
+                player.apply(status)
+                if rng.random() < 0.5:
+                    battle.switch_to_phase(Phase.TURN_START)
+            freeze = player.status_affect.group.get("Freeze", None)
+            if freeze is not None and freeze.is_active:
+                self.assertEqual(player.stat.agility, 0)
+
+            for _ in range(sum(f.stat.health for f in freezes) + 1):
+                battle.switch_to_phase(Phase.TURN_START)
+            self.assertEqual(player.stat.agility, agility)
+
+        for_all(self, freeze_restores_agility)
+
+    def test_battles_terminate(self):
+        def battles_terminate(rng: random.Random):
+            player, opponent = random_character(rng), random_character(rng)
+            player.equip(random_item(rng))
+            opponent.equip(random_item(rng))
+            result = BattleRunner(
+                Battle(player, opponent), ExecutionBudget(max_turns=50)
+            ).run()
+            self.assertLessEqual(result.turns, 50)
+            self.assertEqual(result.is_stalemate, not Battle(player, opponent).is_over)
+            self.assertEqual(Context.current_phase, Phase.BATTLE_END)
+
+        for_all(self, battles_terminate)
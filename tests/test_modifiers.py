@@ -0,0 +1,121 @@
+from unittest import TestCase
+from tests._artifacts import *
+from app.base import *
+from app.modifiers import *
+
+
+class TestModifierStack(TestCase):
+    def setUp(self) -> None:
+        self.changed: list[str] = []
+        self.stack = ModifierStack(self.changed.append)
+
+    def test_layers(self):
+        source1, source2 = object(), object()
+        self.stack.add(source1, StatModifier("attack", 5))
+        self.stack.add(source2, StatModifier("attack", 3))
+        self.stack.add(source2, StatModifier("attack", 2, ModifierLayer.MULTIPLICATIVE))
+        self.assertEqual(self.stack.apply("attack", 10), (10 + 5 + 3) * 2)
+        self.assertEqual(self.stack.apply("defense", 10), 10)
+
+        self.stack.add(source1, StatModifier("attack", 1, ModifierLayer.OVERRIDE))
+        self.assertEqual(self.stack.apply("attack", 10), 1)
+        self.stack.add(
+            source2, StatModifier("attack", 7, ModifierLayer.OVERRIDE, priority=1)
+        )
+        self.assertEqual(self.stack.apply("attack", 10), 7)
+        self.assertEqual(len(self.stack), 5)
+
+        self.assertEqual(len(self.stack.remove(source2)), 3)
+        self.assertEqual(self.stack.apply("attack", 10), 1)
+        self.stack.remove(source1)
+        self.assertEqual(self.stack.apply("attack", 10), 10)
+        self.assertEqual(self.stack.layers, {})
+
+    def test_recompute_is_per_stat(self):
+        source = object()
+        self.stack.add(source, StatModifier("attack", 5))
+        self.stack.add(source, StatModifier("agility", 0, ModifierLayer.OVERRIDE))
+        self.assertEqual(self.changed, ["attack", "agility"])
+        self.stack.remove(source)
+        self.assertEqual(sorted(self.changed[2:]), ["agility", "attack"])
+
+
+class TestCharacterModifiers(TestCase):
+    def setUp(self) -> None:
+        Context.current_phase = Phase.BATTLE_NOT_STARTED
+        self.player: Character | None = Character(**TEST_INPUT["player"])
+
+    def tearDown(self) -> None:
+        self.player = None
+
+    def test_effective_stat(self):
+        source = object()
+        self.player.modifiers.add(source, StatModifier("attack", 5))
+        self.assertEqual(self.player.stat.attack, 25)
+        self.assertEqual(self.player.base_stat.attack, 20)
+
+        self.player.stat.attack -= 10
+        self.assertEqual(self.player.stat.attack, 15)
+        self.assertEqual(self.player.base_stat.attack, 10)
+
+        self.player.modifiers.remove(source)
+        self.assertEqual(self.player.stat.attack, 10)
+
+    def test_writes_through_layers(self):
+        vigor = object()
+        self.player.base_stat.health = 10
+        self.player.mark_stat_dirty("health")
+        self.player.modifiers.add(
+            vigor, StatModifier("health", 1.5, ModifierLayer.MULTIPLICATIVE)
+        )
+        self.assertEqual(self.player.stat.health, 15)
+        self.player.take_damage(5)
+        self.assertEqual(self.player.stat.health, 10)
+        self.player.heal(3)
+        self.assertEqual(self.player.stat.health, 13)
+        self.assertEqual(self.player.base_stat.health, 9)
+
+        self.player.modifiers.add(
+            vigor, StatModifier("health", 50, ModifierLayer.OVERRIDE)
+        )
+        self.player.take_damage(4)
+        self.assertEqual(self.player.stat.health, 50)
+        self.player.modifiers.remove(vigor)
+        self.assertEqual(self.player.stat.health, 5)
+
+    def test_overlapping_effects(self):
+        haste, freeze = object(), object()
+        self.player.modifiers.add(
+            haste, StatModifier("agility", 2, ModifierLayer.MULTIPLICATIVE)
+        )
+        self.player.modifiers.add(
+            freeze, StatModifier("agility", 0, ModifierLayer.OVERRIDE)
+        )
+        self.assertEqual(self.player.stat.agility, 0)
+        self.player.modifiers.remove(haste)
+        self.assertEqual(self.player.stat.agility, 0)
+        self.player.modifiers.remove(freeze)
+        self.assertEqual(self.player.stat.agility, 100)
+
+    def test_stacking_status(self):
+        self.player.status_affect.can_stack = True
+        status1 = Item(
+            flavor={"name": "Slow"},
+            stat={"health": 2},
+            stat_modifiers=[StatModifier("agility", -10)],
+            is_status_affect=True,
+        )
+        status2 = Item(
+            flavor={"name": "Slow"},
+            stat={"health": 2},
+            stat_modifiers=[StatModifier("agility", -10)],
+            is_status_affect=True,
+        )
+        self.assertEqual(self.player.apply(status1), status1)
+        self.assertEqual(self.player.apply(status2), status1)
+        self.assertEqual(status1.stacks, 2)
+        self.assertEqual(status1.stat.health, 4)
+        self.assertEqual(self.player.stat.agility, 80)
+
+        self.assertEqual(self.player.unapply(status1), status1)
+        self.assertEqual(self.player.stat.agility, 100)
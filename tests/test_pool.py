@@ -0,0 +1,90 @@
+from unittest import TestCase
+from tests._artifacts import *
+from app.base import *
+from app.pool import *
+from app.status.afflictions.elemental import Burning
+
+
+class TestItemPool(TestCase):
+    def setUp(self) -> None:
+        Context.current_phase = Phase.BATTLE_NOT_STARTED
+        self.player: Character | None = Character(**TEST_INPUT["player"])
+        self.opponent: Character | None = Character()
+        self.battle: Battle | None = Battle(self.player, self.opponent)
+        self.pool = ItemPool(max_size=2)
+
+    def tearDown(self) -> None:
+        self.player = None
+        self.opponent = None
+        self.battle = None
+
+    def test_acquire_release(self):
+        burning = self.pool.acquire("Burning")
+        prototype = self.pool.prototype("Burning")
+        self.assertIsInstance(burning, Burning)
+        self.assertIs(burning.flavor, prototype.flavor)
+        self.assertIs(burning.stat_to_equip, prototype.stat_to_equip)
+        self.assertIsNot(burning.stat, prototype.stat)
+        self.assertIs(burning.functions_by_phase[Phase.TURN_START].__self__, burning)
+        self.assertIs(burning.pool, self.pool)
+        burning.stat.health = 0
+        burning.stacks = 3
+
+        self.assertTrue(self.pool.release(burning))
+        self.assertFalse(self.pool.release(burning))
+        self.assertIs(self.pool.acquire("Burning"), burning)
+        self.assertEqual(burning.stat.health, 2)
+        self.assertEqual(burning.stacks, 1)
+        self.assertEqual((self.pool.created, self.pool.reused), (1, 1))
+
+        self.assertFalse(self.pool.release(Burning()))
+        items = [self.pool.acquire("Burning") for _ in range(3)]
+        self.assertEqual([self.pool.release(i) for i in items], [True, True, False])
+
+    def test_reset_restores_prototype(self):
+        burning = self.pool.acquire("Burning")
+        burning.register_damage_modifier("armor", lambda hit: None)
+        burning.register_action("flare", [Phase.TURN_START], print)
+        burning.wear_out_rate = 7
+        burning.label = "used"
+        self.pool.release(burning)
+
+        self.assertIs(self.pool.acquire("Burning"), burning)
+        self.assertEqual(burning.damage_modifiers, {})
+        self.assertEqual(burning.actions, {})
+        self.assertEqual(burning.wear_out_rate, 1)
+        self.assertFalse(hasattr(burning, "label"))
+        self.assertIs(burning.pool, self.pool)
+
+    def test_shared_parts_are_immutable(self):
+        burning = self.pool.acquire("Burning")
+        with self.assertRaises(AttributeError):
+            burning.flavor.type.append("ICE")
+        with self.assertRaises(AttributeError):
+            burning.flavor.name = "Scorched"
+        with self.assertRaises(AttributeError):
+            burning.stat_to_equip.strength = 0
+        self.assertEqual(self.pool.acquire("Burning").flavor.type, ("FIRE",))
+
+    def test_rejected_status_is_recycled(self):
+        first = self.pool.acquire("Freeze")
+        self.assertEqual(self.player.apply(first), first)
+        self.assertFalse(self.pool.release(first))
+
+        second = self.pool.acquire("Freeze")
+        self.assertIsNone(self.player.apply(second))
+        self.assertIs(self.pool.acquire("Freeze"), second)
+        self.assertEqual(self.player.stat.agility, 0)
+
+    def test_unapplied_status_is_recycled(self):
+        freeze = self.pool.acquire("Freeze")
+        self.player.apply(freeze)
+        self.assertEqual(self.player.unapply(freeze), freeze)
+        self.assertIsNone(freeze.equipped_by)
+        self.assertIs(self.pool.acquire("Freeze"), freeze)
+
+        self.player.apply(freeze)
+        self.player.apply(self.pool.acquire("Burning"))
+        self.assertNotIn("Freeze", self.player.status_affect.group)
+        self.assertIs(self.pool.acquire("Freeze"), freeze)
+        self.assertEqual((self.pool.created, self.pool.reused), (2, 2))
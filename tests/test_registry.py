@@ -0,0 +1,50 @@
+import subprocess
+import sys
+from unittest import TestCase
+from app.manifest import MANIFEST
+from app.registry import *
+
+
+class TestLazyRegistry(TestCase):
+    def test_manifest_is_up_to_date(self):
+        self.assertEqual(build_manifest(), MANIFEST)
+
+    def test_lookup(self):
+        lazy = LazyRegistry(MANIFEST)
+        self.assertIn("FlameSword", lazy)
+        self.assertNotIn("FlameSword", lazy.loaded)
+        sword = lazy.create("FlameSword")
+        self.assertEqual(sword.flavor.name, "FlameSword")
+        self.assertIs(lazy["FlameSword"], type(sword))
+        self.assertIsNone(lazy.get("Unknown"))
+        with self.assertRaises(KeyError):
+            lazy["Unknown"]
+
+    def test_import_is_lazy(self):
+        modules = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, app.registry; print(' '.join(sorted(sys.modules)))",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+        self.assertNotIn("app.base", modules)
+        self.assertNotIn("attr", modules)
+
+        modules = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, app.items.weapons.swords; print(' '.join(sys.modules))",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+        self.assertNotIn("app.status.afflictions.elemental", modules)
+
+    def test_importtime(self):
+        self.assertIn("app.registry", importtime("app.registry"))
@@ -0,0 +1,75 @@
+import os
+import tempfile
+from unittest import TestCase
+from tests.test_simulation import SWORDSMAN
+from tests._artifacts import *
+from app.base import *
+from app.replay import *
+from app.simulation import run_battle
+
+
+class TestReplay(TestCase):
+    def setUp(self) -> None:
+        Context.current_phase = Phase.BATTLE_NOT_STARTED
+        self.matchup = Matchup(
+            player={
+                "flavor": TEST_INPUT["player"]["flavor"],
+                "stat": TEST_INPUT["player"]["stat"] | {"health": 60},
+            },
+            opponent=SWORDSMAN,
+            player_items=["FlameSword"],
+            opponent_items=["FrostSword"],
+            parameters={"player.FlameSword.burning_probability": 60},
+        )
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_record(self):
+        record = record_battle(self.matchup, 3)
+        self.assertEqual(record.outcome, run_battle(self.matchup, 3))
+        self.assertEqual(len(record.actions), record.outcome.turns * 2 - 1)
+        self.assertEqual(set(record.actions), {"perform_item_attack"})
+
+    def test_corpus_roundtrip(self):
+        corpus = record_corpus([self.matchup, default_matchups()[0]], 4)
+        self.assertEqual([r.seed for r in corpus], list(range(8)))
+        path = os.path.join(self.directory.name, "corpus.jsonl")
+        save_corpus(path, corpus)
+        with open(path, "a") as output:
+            output.write("\n")
+        self.assertEqual(load_corpus(path), corpus)
+
+    def test_replay_against_baseline(self):
+        corpus = record_corpus([self.matchup], 5)
+        first = replay_corpus(corpus, repeat=1)
+        self.assertTrue(first.ok)
+        self.assertIsNone(first.baseline)
+
+        path = os.path.join(self.directory.name, "timings.json")
+        save_timings(path, first)
+        second = replay_corpus(corpus, load_timings(path), repeat=1)
+        self.assertTrue(second.ok)
+        self.assertEqual(second.baseline, first.elapsed)
+        self.assertAlmostEqual(
+            second.results[0].delta,
+            second.results[0].elapsed - first.timings()[corpus[0].key],
+        )
+        self.assertIn("vs baseline", second.report())
+
+        corpus = corpus[::-1] + [record_battle(self.matchup, 9)]
+        shuffled = replay_corpus(corpus, load_timings(path), repeat=1)
+        self.assertIsNone(shuffled.baseline)
+        shuffled.results.pop()
+        for result in shuffled.results:
+            self.assertEqual(result.baseline, first.timings()[result.record.key])
+
+    def test_mismatch(self):
+        corpus = record_corpus([self.matchup], 2)
+        corpus[0].actions[0] = None
+        corpus[1].outcome.turns += 1
+        report = replay_corpus(corpus, repeat=1)
+        self.assertFalse(report.ok)
+        self.assertEqual(len(report.mismatches), 2)
+        self.assertEqual(report.report().count("MISMATCH"), 2)
@@ -0,0 +1,115 @@
+import io
+from unittest import TestCase
+from tests._artifacts import *
+from app.base import *
+from app.items.weapons.swords import *
+from app.savefile import *
+from app.status.afflictions.elemental import *
+
+
+class TestSaveFile(TestCase):
+    def setUp(self) -> None:
+        Context.current_phase = Phase.BATTLE_NOT_STARTED
+        self.player: Character | None = Character(**TEST_INPUT["player"])
+        self.opponent: Character | None = Character(**TEST_INPUT["opponent"])
+        self.battle: Battle | None = Battle(self.player, self.opponent)
+
+    def tearDown(self) -> None:
+        self.player = None
+        self.opponent = None
+        self.battle = None
+
+    def assertSameCharacter(self, loaded: Character, character: Character):
+        self.assertEqual(loaded.flavor, character.flavor)
+        self.assertEqual(loaded.base_stat, character.base_stat)
+        self.assertEqual(loaded.stat.to_dict(), character.stat.to_dict())
+        self.assertEqual(loaded.is_player, character.is_player)
+        self.assertEqual(
+            list(loaded.equipped.group.keys()), list(character.equipped.group.keys())
+        )
+        self.assertEqual(
+            list(loaded.status_affect.group.keys()),
+            list(character.status_affect.group.keys()),
+        )
+        self.assertEqual(len(loaded.modifiers), len(character.modifiers))
+
+    def test_item(self):
+        item = Item(**TEST_INPUT["item"])
+        sword = FlameSword()
+        sword.stat.health = 3
+        sword.burning_probability = 100
+        item.label = "tuned"
+        loaded_item, loaded_sword = loads(dumps([item, sword]))
+
+        self.assertIs(type(loaded_item), Item)
+        self.assertEqual(loaded_item.flavor, item.flavor)
+        self.assertEqual(loaded_item.stat_to_equip, item.stat_to_equip)
+        self.assertTrue(loaded_item.can_defend)
+        self.assertIs(type(loaded_sword), FlameSword)
+        self.assertEqual(loaded_sword.stat.health, 3)
+        self.assertEqual(loaded_sword.wear_out_rate, 2)
+        self.assertEqual(loaded_sword.burning_probability, 100)
+        self.assertEqual(loaded_item.label, "tuned")
+        self.assertEqual(Item().stat_to_equip, loads(dumps([Item()]))[0].stat_to_equip)
+
+    def test_character(self):
+        self.player.equip(Item(**TEST_INPUT["item"]))
+        self.player.apply(Freeze())
+        self.player.take_damage(4)
+        (loaded,) = loads(dumps([self.player]))
+
+        self.assertSameCharacter(loaded, self.player)
+        self.assertEqual(loaded.stat.agility, 0)
+        freeze = loaded.status_affect.group["Freeze"]
+        self.assertIs(freeze.equipped_by, loaded)
+        freeze.stat.health = 0
+        freeze.wear_off()
+        self.assertEqual(loaded.stat.agility, 108)
+
+        item = loaded.equipped.group["item"]
+        self.assertEqual(loaded.unequip(item), item)
+        self.assertEqual(loaded.stat.to_dict(), loaded.base_stat.to_dict())
+
+    def test_battle(self):
+        self.player.equip(IronSword())
+        self.battle.switch_to_phase(Phase.BATTLE_START)
+        self.battle.switch_to_phase(Phase.TURN_START)
+        self.battle.switch_to_phase(Phase.TURN_END)
+
+        writer = SaveWriter()
+        writer.write_many([self.battle, self.battle])
+        stream = io.BytesIO()
+        writer.flush(stream)
+        self.assertEqual(writer.record_count, 0)
+
+        saved, _ = loads(memoryview(stream.getvalue()))
+        self.assertEqual(saved.current_phase, Phase.TURN_END)
+        self.assertEqual(saved.current_turn, 2)
+        self.assertSameCharacter(saved.player, self.player)
+        self.assertSameCharacter(saved.opponent, self.opponent)
+
+        Context.current_phase = Phase.BATTLE_NOT_STARTED
+        battle = saved.restore()
+        self.assertIs(Context.player, saved.player)
+        self.assertEqual(Context.current_turn, 2)
+        self.assertIsInstance(battle, Battle)
+
+    def test_battles_in_one_batch(self):
+        self.battle.switch_to_phase(Phase.BATTLE_START)
+        other = Battle(Character(flavor={"name": "c"}), Character(flavor={"name": "d"}))
+        saved, saved_other = loads(dumps([self.battle, other]))
+        self.assertSameCharacter(saved.player, self.player)
+        self.assertSameCharacter(saved.opponent, self.opponent)
+        self.assertEqual(saved.current_phase, Phase.BATTLE_START)
+        self.assertEqual(saved_other.player.flavor.name, "c")
+        self.assertEqual(saved_other.opponent.flavor.name, "d")
+
+    def test_format(self):
+        data = dumps([self.player, self.opponent])
+        self.assertEqual(data[:4], SAVE_MAGIC)
+        with self.assertRaises(ValueError):
+            loads(b"JUNK" + data[4:])
+        with self.assertRaises(ValueError):
+            loads(data[:4] + b"\xff\xff" + data[6:])
+        with self.assertRaises(TypeError):
+            dumps([object()])
@@ -0,0 +1,106 @@
+import asyncio
+import random
+from unittest import TestCase
+from tests.test_simulation import SWORDSMAN
+from tests._artifacts import *
+from app.base import *
+from app.session import *
+from app.simulation import Matchup
+
+
+def attack(decisions: list[Decision]) -> list[str | None]:
+    return ["perform_item_attack" for _ in decisions]
+
+
+class TestBattleSession(TestCase):
+    def setUp(self) -> None:
+        Context.current_phase = Phase.BATTLE_NOT_STARTED
+        self.matchup = Matchup(
+            player={
+                "flavor": TEST_INPUT["player"]["flavor"],
+                "stat": TEST_INPUT["player"]["stat"] | {"health": 60},
+            },
+            opponent=SWORDSMAN,
+            player_items=["FrostSword"],
+            opponent_items=["IronSword"],
+        )
+
+    def battle(self, seed: int) -> Battle:
+        return Battle(*self.matchup.build(), random.Random(seed))
+
+    def health(self, battle: Battle) -> tuple[int, int]:
+        return battle.player.stat.health, battle.opponent.stat.health
+
+    def test_yields_decisions(self):
+        battle = self.battle(0)
+        steps = battle.steps()
+        decision = next(steps)
+        self.assertIs(decision.character, battle.player)
+        self.assertEqual(decision.phase, Phase.PLAYER_ATTACK_START)
+        self.assertEqual(decision.turn, 1)
+        self.assertEqual(
+            set(decision.actions), {"perform_item_attack", "shoot_ice_bolts"}
+        )
+        self.assertIs(steps.send("not_an_action"), decision)
+        decision.actions.clear()
+        self.assertIn("shoot_ice_bolts", battle.player.get_available_actions())
+
+        health = battle.opponent.stat.health
+        decision = steps.send("shoot_ice_bolts")
+        self.assertIs(decision.character, battle.opponent)
+        self.assertLess(battle.opponent.stat.health, health)
+
+    def test_invalid_choice_raises_when_driven(self):
+        class Typo(Battle):
+            def choose_action(self, character, actions):
+                return "typo"
+
+        battle = Typo(*self.matchup.build(), random.Random(0))
+        with self.assertRaises(KeyError):
+            battle.run(max_turns=3)
+
+    def test_matches_run(self):
+        for seed in range(10):
+            expected_battle = self.battle(seed)
+            expected = expected_battle.run()
+            expected_health = self.health(expected_battle)
+            session = BattleSession(self.battle(seed))
+            self.assertEqual(run_sessions([session], attack), [session.winner])
+            self.assertEqual(session.winner.is_player, expected.is_player)
+            self.assertEqual(self.health(session.battle), expected_health)
+
+    def test_interleaved_sessions(self):
+        expected = []
+        for seed in range(8):
+            battle = self.battle(seed)
+            battle.run()
+            expected.append((self.health(battle), Context.current_turn))
+
+        sessions = [BattleSession(self.battle(seed)) for seed in range(8)]
+        batches: list[int] = []
+
+        def decide(decisions: list[Decision]) -> list[str | None]:
+            batches.append(len(decisions))
+            return attack(decisions)
+
+        run_sessions(sessions, decide)
+        self.assertEqual(batches[0], 8)
+        self.assertEqual(
+            [(self.health(s.battle), s.context["current_turn"]) for s in sessions],
+            expected,
+        )
+        self.assertIsNone(sessions[0].resume("perform_item_attack"))
+
+    def test_async(self):
+        sessions = [BattleSession(self.battle(seed)) for seed in range(4)]
+
+        async def decide(decision: Decision) -> str | None:
+            await asyncio.sleep(0)
+            return "perform_item_attack"
+
+        async def main():
+            return await asyncio.gather(*(play(s, decide) for s in sessions))
+
+        winners = asyncio.run(main())
+        self.assertEqual(winners, [s.winner for s in sessions])
+        self.assertTrue(all(s.is_over for s in sessions))
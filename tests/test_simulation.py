@@ -0,0 +1,65 @@
+from unittest import TestCase
+from tests._artifacts import *
+from app.simulation import *
+
+SWORDSMAN: dict[str, Any] = {
+    "flavor": {"name": "swordsman"},
+    "stat": {"health": 60, "attack": 5, "strength": 20, "agility": 60},
+}
+
+
+class TestSimulation(TestCase):
+    def setUp(self) -> None:
+        self.matchup = Matchup(
+            player={
+                "flavor": TEST_INPUT["player"]["flavor"],
+                "stat": TEST_INPUT["player"]["stat"] | {"health": 60},
+            },
+            opponent=SWORDSMAN,
+            player_items=["FlameSword"],
+            opponent_items=["IronSword"],
+        )
+
+    def test_build(self):
+        matchup = self.matchup.with_parameters(
+            {
+                "player.FlameSword.burning_probability": 80,
+                "opponent.IronSword.stat.attack": 1,
+                "opponent.stat.health": 30,
+            }
+        )
+        player, opponent = matchup.build()
+        self.assertEqual(player.equipped.group["FlameSword"].burning_probability, 80)
+        self.assertEqual(opponent.equipped.group["IronSword"].stat.attack, 1)
+        self.assertEqual(opponent.stat.health, 30)
+        self.assertEqual(self.matchup.parameters, {})
+        with self.assertRaises(KeyError):
+            self.matchup.with_parameters({"nobody.stat.health": 1}).build()
+
+    def test_run_battle_is_deterministic(self):
+        self.assertEqual(run_battle(self.matchup, 7), run_battle(self.matchup, 7))
+
+    def test_run_batch(self):
+        result = run_batch(self.matchup, 20, seed=3)
+        self.assertEqual(result.battles, 20)
+        self.assertEqual(result, run_batch(self.matchup, 20, seed=3))
+        low, high = result.interval
+        self.assertTrue(low <= result.win_rate <= high)
+
+        merged = BatchResult()
+        merged.merge(result)
+        merged.add(BattleOutcome(None, 100, 1, 1))
+        self.assertEqual(merged.draws, result.draws + 1)
+
+    def test_run_until_converged(self):
+        target = ConvergenceTarget(win_rate_precision=0.1, max_battles=400)
+        result, converged = run_until_converged(self.matchup, target, seed=5)
+        self.assertTrue(converged)
+        self.assertTrue(target.min_battles <= result.battles < target.max_battles)
+        self.assertLessEqual(result.half_width, 0.1)
+        self.assertEqual(result.turns_to_kill.count, result.wins + result.losses)
+
+        target = ConvergenceTarget(win_rate_precision=0.0001, max_battles=40)
+        result, converged = run_until_converged(self.matchup, target, seed=5)
+        self.assertFalse(converged)
+        self.assertEqual(result.battles, 40)
@@ -0,0 +1,94 @@
+from unittest import TestCase
+from tests._artifacts import *
+from app.base import *
+from app.manifest import MANIFEST
+from app.pool import *
+from app.registry import LazyRegistry
+from app.spawner import *
+from app.state import character_key
+
+
+class Charm(Item):
+    def __init__(self) -> None:
+        Item.__init__(
+            self,
+            flavor={"name": "Charm"},
+            stat_on_equip={"strength": 5},
+            stat_to_equip={},
+            can_equip=True,
+            can_equip_at="NECK",
+        )
+
+    def bind_to(self, equip_character: Character):
+        super().bind_to(equip_character)
+        equip_character.modifiers.add(self, StatModifier("luck", 1))
+
+
+class TestSpawner(TestCase):
+    def setUp(self) -> None:
+        Context.current_phase = Phase.BATTLE_NOT_STARTED
+        self.template = CharacterTemplate(
+            flavor={"name": "grunt", "category": "UNDEAD", "type": ["SKELETON"]},
+            stat={"health": 50, "strength": 15, "intelligence": 9, "agility": 30},
+            jitter={"health": 10, "strength": 6, "intelligence": 3},
+            loadouts=sword_loadouts(),
+        )
+        self.pool = ItemPool()
+
+    def test_columns(self):
+        wave = spawn_wave(self.template, 500, seed=1, pool=self.pool)
+        self.assertEqual(len(wave), 500)
+        self.assertTrue(all(40 <= h <= 60 for h in wave.column("health")))
+        self.assertEqual(set(wave.column("agility")), {30})
+        self.assertEqual(wave.stat(3).agility, 30)
+        self.assertEqual(
+            {wave.loadout(i) for i in range(len(wave))}, set(self.template.loadouts)
+        )
+        self.assertEqual(
+            spawn_wave(self.template, 500, seed=1, pool=self.pool).equippable,
+            wave.equippable,
+        )
+
+    def test_batch_validation_matches_equip(self):
+        wave = spawn_wave(self.template, 300, seed=2, pool=self.pool)
+        self.assertGreater(wave.rejected, 0)
+        self.assertLess(wave.rejected, len(wave))
+        for i in range(len(wave)):
+            expected = Character(
+                flavor=self.template.flavor, stat=wave.stat(i).to_dict()
+            )
+            for name in wave.loadout(i):
+                expected.equip(self.pool.acquire(name))
+            spawned = wave.build(i)
+            self.assertEqual(character_key(spawned), character_key(expected))
+            self.assertEqual(tuple(spawned.equipped.group), wave.equippable[i])
+
+    def test_loadout_requirements_chain(self):
+        self.pool = ItemPool(items=LazyRegistry(MANIFEST | {"Charm": __name__}))
+        template = CharacterTemplate(
+            stat={"strength": 14},
+            jitter={"strength": 1},
+            loadouts=[("Charm", "SilverSword"), ("IronSword", "RustedSword")],
+        )
+        wave = spawn_wave(template, 50, seed=0, pool=self.pool)
+        expected = {
+            (("Charm", "SilverSword"), 13): ("Charm", "SilverSword"),
+            (("Charm", "SilverSword"), 14): ("Charm", "SilverSword"),
+            (("Charm", "SilverSword"), 15): ("Charm", "SilverSword"),
+            (("IronSword", "RustedSword"), 13): ("RustedSword",),
+            (("IronSword", "RustedSword"), 14): ("RustedSword",),
+            (("IronSword", "RustedSword"), 15): ("IronSword",),
+        }
+        for i in range(len(wave)):
+            key = (wave.loadout(i), wave.stat(i).strength)
+            self.assertEqual(wave.equippable[i], expected[key])
+        charmed = wave.loadout(0)[0] == "Charm"
+        spawned = wave.build(0)
+        self.assertEqual(spawned.stat.strength, wave.stat(0).strength + 5 * charmed)
+        self.assertEqual(spawned.stat.luck, int(charmed))
+
+    def test_flavor_not_shared(self):
+        first, second = spawn_wave(self.template, 2, pool=self.pool).characters()
+        first.flavor.type.append("BOSS")
+        self.assertEqual(second.flavor.type, ["SKELETON"])
+        self.assertEqual(self.template.flavor["type"], ["SKELETON"])
@@ -0,0 +1,106 @@
+import random
+from unittest import TestCase
+from tests.test_simulation import SWORDSMAN
+from tests._artifacts import *
+from app.base import *
+from app.items.weapons.swords import FlameSword, IronSword, RustedSword
+from app.simulation import *
+from app.state import *
+from app.status.afflictions.elemental import Burning
+from app.status.afflictions.poisonous import Poisoned
+
+
+class TestCanonicalState(TestCase):
+    def setUp(self) -> None:
+        Context.current_phase = Phase.BATTLE_NOT_STARTED
+
+    def build(self, swords: list[type], statuses: list[type]) -> StateKey:
+        player = Character(**TEST_INPUT["player"])
+        opponent = Character(**TEST_INPUT["opponent"])
+        Battle(player, opponent)
+        for sword in swords:
+            item = sword()
+            item.can_equip_at = "HAND2" if sword is RustedSword else "HAND1"
+            player.equip(item)
+        for status in statuses:
+            opponent.apply(status())
+        return canonical_state()
+
+    def test_order_independent(self):
+        first = self.build([IronSword, RustedSword], [Burning, Poisoned])
+        second = self.build([RustedSword, IronSword], [Poisoned, Burning])
+        self.assertNotEqual(
+            [type(i) for i in Context.player.equipped.group.values()],
+            [IronSword, RustedSword],
+        )
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), state_hash())
+
+    def test_state_changes(self):
+        state = self.build([IronSword], [Burning])
+        Context.player.equipped.group["IronSword"].wear_out()
+        worn = canonical_state()
+        self.assertNotEqual(state, worn)
+
+        Context.opponent.status_affect.group["Burning"].on_start_turn_phase()
+        self.assertNotEqual(worn, canonical_state())
+
+        Context.current_phase = Phase.TURN_START
+        self.assertNotEqual(state, canonical_state())
+
+    def test_item_parameters(self):
+        state = self.build([FlameSword], [])
+        Context.player.equipped.group["FlameSword"].burning_probability = 80
+        self.assertNotEqual(state, canonical_state())
+
+
+class TestOutcomeCache(TestCase):
+    def test_bounded(self):
+        cache = OutcomeCache(max_size=2, min_samples=2)
+        cache.record("a", "win")
+        self.assertIsNone(cache.get("a"))
+        cache.record("a", "loss")
+        cache.record("b", "win")
+        self.assertEqual(cache.get("a").samples, 2)
+        cache.record("c", "win")
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn("b", cache)
+        self.assertIn("a", cache)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        distribution = cache.get("a")
+        self.assertEqual(distribution.probability(lambda o: o == "win"), 0.5)
+        rng = random.Random(0)
+        self.assertEqual({distribution.sample(rng) for _ in range(50)}, {"win", "loss"})
+
+    def test_memoized_batch(self):
+        Context.current_phase = Phase.BATTLE_NOT_STARTED
+        matchup = Matchup(
+            player={
+                "flavor": TEST_INPUT["player"]["flavor"],
+                "stat": TEST_INPUT["player"]["stat"] | {"health": 60},
+            },
+            opponent=SWORDSMAN,
+            player_items=["FlameSword"],
+            opponent_items=["IronSword"],
+        )
+        cache = OutcomeCache(min_samples=8)
+        memoized = run_batch(matchup, 300, cache=cache)
+        plain = run_batch(matchup, 300)
+        self.assertGreater(cache.hit_rate, 0.5)
+        self.assertEqual(memoized.battles, plain.battles)
+        self.assertEqual(plain.simulated, plain.battles)
+        self.assertGreater(memoized.simulated, cache.min_samples)
+        self.assertLess(memoized.simulated, memoized.battles)
+        self.assertGreater(memoized.half_width, plain.half_width)
+        self.assertAlmostEqual(memoized.win_rate, plain.win_rate, delta=0.05)
+        self.assertAlmostEqual(memoized.mean_turns, plain.mean_turns, delta=0.3)
+
+        again = OutcomeCache(min_samples=8)
+        self.assertEqual(run_batch(matchup, 300, cache=again), memoized)
+
+        Battle(*matchup.build())
+        Context.current_phase = Phase.BATTLE_START
+        self.assertEqual(predict(cache, 100).samples, 300)
+        with self.assertRaises(ValueError):
+            run_batch(matchup, 1, cache=cache, budget=ExecutionBudget(10))
@@ -0,0 +1,71 @@
+from concurrent.futures import ProcessPoolExecutor
+from unittest import TestCase
+from tests.test_simulation import SWORDSMAN
+from app.simulation import Matchup
+from app.sweep import *
+
+
+class TestSweep(TestCase):
+    def setUp(self) -> None:
+        self.matchup = Matchup(
+            player=SWORDSMAN | {"flavor": {"name": "player"}},
+            opponent=SWORDSMAN,
+            player_items=["FlameSword"],
+            opponent_items=["IronSword"],
+        )
+        self.parameters = [
+            Parameter("player.FlameSword.burning_probability", [0, 50, 100]),
+            Parameter("player.FlameSword.stat.attack", low=1, high=2),
+        ]
+
+    def test_grid(self):
+        configurations = grid(self.parameters)
+        self.assertEqual(len(configurations), 6)
+        self.assertEqual(
+            configurations[1],
+            {
+                "player.FlameSword.burning_probability": 0,
+                "player.FlameSword.stat.attack": 2,
+            },
+        )
+        with self.assertRaises(ValueError):
+            grid([Parameter("x", low=0.0, high=1.0, integer=False)])
+
+    def test_latin_hypercube(self):
+        parameters = [Parameter("a", low=0, high=99), Parameter("b", [1, 2, 3, 4])]
+        samples = latin_hypercube(parameters, 4, seed=1)
+        self.assertEqual(len(samples), 4)
+        self.assertEqual(sorted(s["b"] for s in samples), [1, 2, 3, 4])
+        self.assertEqual(sorted(s["a"] // 25 for s in samples), [0, 1, 2, 3])
+        self.assertEqual(samples, latin_hypercube(parameters, 4, seed=1))
+
+    def test_run_sweep(self):
+        sweep = run_sweep(
+            self.matchup,
+            grid(self.parameters[:1]),
+            tolerance=0.1,
+            batch_size=20,
+            max_battles=100,
+        )
+        self.assertEqual(len(sweep.points), 3)
+        for point in sweep.points:
+            self.assertTrue(point.converged or point.result.battles == 100)
+            self.assertEqual(point.result.battles % 20, 0)
+        surface = sweep.surface("player.FlameSword.burning_probability")
+        self.assertEqual(sorted(surface.keys()), [0, 50, 100])
+        self.assertIn("win_rate=", sweep.report())
+
+    def test_run_sweep_with_executor(self):
+        configurations = grid(self.parameters[:1])
+        with ProcessPoolExecutor(2) as executor:
+            parallel = run_sweep(
+                self.matchup,
+                configurations,
+                batch_size=10,
+                max_battles=20,
+                executor=executor,
+            )
+        sequential = run_sweep(
+            self.matchup, configurations, batch_size=10, max_battles=20
+        )
+        self.assertEqual(parallel, sequential)
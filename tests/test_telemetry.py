@@ -0,0 +1,108 @@
+import os
+import tempfile
+import threading
+from unittest import TestCase
+from tests.test_simulation import SWORDSMAN
+from tests._artifacts import *
+from app.base import *
+from app.simulation import *
+from app.telemetry import *
+
+
+class TestMetrics(TestCase):
+    def test_shards_merged_on_read(self):
+        metrics = Metrics()
+
+        def work():
+            for _ in range(1000):
+                metrics.inc("hits")
+                metrics.observe("damage_per_hit", 2)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        metrics.inc("affliction_procs", affliction="Burning")
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(len(metrics.shards), 5)
+        self.assertEqual(snapshot.counter("hits"), 4000)
+        self.assertEqual(snapshot.summary("damage_per_hit"), (4000, 8000))
+        self.assertEqual(snapshot.counter("affliction_procs", affliction="Burning"), 1)
+
+    def test_prometheus(self):
+        metrics = Metrics()
+        metrics.inc("affliction_procs", 2, affliction='Bu"rn')
+        metrics.observe("damage_per_hit", 5)
+        metrics.set_gauge("queue_depth", 3)
+        self.assertEqual(
+            to_prometheus(metrics.snapshot()),
+            "# TYPE battlesim_affliction_procs_total counter\n"
+            'battlesim_affliction_procs_total{affliction="Bu\\"rn"} 2\n'
+            "# TYPE battlesim_damage_per_hit summary\n"
+            "battlesim_damage_per_hit_sum 5\n"
+            "battlesim_damage_per_hit_count 1\n"
+            "# TYPE battlesim_queue_depth gauge\n"
+            "battlesim_queue_depth 3\n",
+        )
+
+
+class TestBattleTelemetry(TestCase):
+    def setUp(self) -> None:
+        Context.current_phase = Phase.BATTLE_NOT_STARTED
+        self.matchup = Matchup(
+            player={
+                "flavor": TEST_INPUT["player"]["flavor"],
+                "stat": TEST_INPUT["player"]["stat"] | {"health": 60},
+            },
+            opponent=SWORDSMAN,
+            player_items=["FlameSword"],
+            opponent_items=["IronSword"],
+        )
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "battlesim.prom")
+        self.telemetry = BattleTelemetry(sink=FileSink(self.path)).install()
+
+    def tearDown(self) -> None:
+        self.telemetry.uninstall()
+        self.directory.cleanup()
+
+    def test_battle_metrics(self):
+        result = run_batch(self.matchup, 5, telemetry=self.telemetry)
+        snapshot = self.telemetry.snapshot()
+        self.assertEqual(snapshot.counter("battles"), 5)
+        self.assertEqual(snapshot.gauge("queue_depth"), 0)
+        self.assertGreater(snapshot.gauge("battles_per_second"), 0)
+        hits = snapshot.counter("hits")
+        self.assertGreater(hits, 0)
+        self.assertEqual(snapshot.summary("damage_per_hit")[0], hits)
+        turn_starts = snapshot.summary("phase_duration_seconds", phase="TURN_START")
+        self.assertGreater(turn_starts[0], 0)
+        self.assertAlmostEqual(
+            snapshot.gauge("mean_turns"),
+            (result.turns_to_kill.mean * result.turns_to_kill.count)
+            / result.battles,
+        )
+        burning = snapshot.counter("affliction_procs", affliction="Burning")
+        self.assertGreater(burning, 0)
+        with open(self.path) as exported:
+            self.assertIn("battlesim_battles_total 1\n", exported.read())
+
+    def test_sampling(self):
+        self.telemetry.uninstall()
+        sampled = BattleTelemetry(sample_every=10).install()
+        try:
+            run_batch(self.matchup, 5)
+        finally:
+            sampled.uninstall()
+        snapshot = sampled.snapshot()
+        hits = snapshot.counter("hits")
+        self.assertLess(snapshot.summary("damage_per_hit")[0], hits)
+        self.assertGreater(snapshot.summary("damage_per_hit")[0], 0)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_outcomes_unchanged(self):
+        with_telemetry = run_batch(self.matchup, 5)
+        self.telemetry.uninstall()
+        self.assertEqual(run_batch(self.matchup, 5), with_telemetry)